@@ -226,7 +226,10 @@ def init_session_state():
     
     if 'gemini_analyzer' not in st.session_state:
         from sodapop.generators.gemini import GeminiAnalyzer
-        st.session_state.gemini_analyzer = GeminiAnalyzer(api_key=st.session_state.gemini_api_key)
+        st.session_state.gemini_analyzer = GeminiAnalyzer(
+            api_key=st.session_state.gemini_api_key,
+            semantic_cache_dir="data/cache/gemini",
+        )
     
     if 'current_level' not in st.session_state:
         st.session_state.current_level = AdminLevel.SIDO
@@ -377,6 +380,9 @@ def load_real_data(region_code: str):
                 if processed:
                     # Update session data
                     st.session_state.demo_data.update(processed)
+                    # Ranking charts cache a columnar copy of demo_data
+                    if 'ranking_viz' in st.session_state:
+                        st.session_state.ranking_viz.clear_cache()
                     st.success(f"✅ {region_code} 데이터 로드 완료 (newEst=Y)")
                     return True
             else:
@@ -446,7 +452,7 @@ def render_urgency_badge(level: UrgencyLevel) -> str:
         UrgencyLevel.MODERATE: "보통",
         UrgencyLevel.LOW: "낮음",
     }
-    return f'<span class="urgency-badge urgency-{level.name.lower()}">{level_names[level]}</span>'
+    return f'<span class="urgency-badge urgency-{level.key}">{level_names[level]}</span>'
 
 
 def render_breadcrumb(regions: List[Region]) -> None:
@@ -841,9 +847,14 @@ def main():
                 
                 if st.button("🚀 근거문 생성", type="primary", use_container_width=True):
                     if use_gemini:
-                        with st.spinner("Gemini AI가 인구 데이터를 심층 분석 중..."):
-                            rationale = st.session_state.gemini_analyzer.analyze_insight(demo, metrics)
-                            st.session_state.last_rationale = rationale
+                        # Show text as it streams in, then replace it with the result box below
+                        stream_box = st.empty()
+                        with stream_box.container():
+                            rationale = st.write_stream(
+                                st.session_state.gemini_analyzer.iter_insight(demo, metrics)
+                            )
+                        stream_box.empty()
+                        st.session_state.last_rationale = rationale
                     else:
                         with st.spinner("데이터 기반 근거문 생성 중..."):
                             if output_type == "사업계획서 삽입용 문구":
@@ -33,6 +33,14 @@ class UrgencyLevel(Enum):
     ELEVATED = 3    # Above normal concern
     MODERATE = 2    # Standard monitoring
     LOW = 1         # Minimal intervention needed
+    
+    # Lowercase name used as template/CSS key, attached once below
+    key: str
+
+
+for _level in UrgencyLevel:
+    _level.key = _level.name.lower()
+del _level
 
 
 @dataclass
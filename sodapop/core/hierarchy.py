@@ -10,7 +10,7 @@ Implements the "Antigravity" principle of seamless traversal.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from enum import Enum
 import re
 
@@ -115,8 +115,11 @@ class KIKcdHierarchy:
     def __init__(self):
         self._regions: Dict[str, Region] = {}
         self._hierarchy_root: Optional[HierarchyNode] = None
-        self._sido_index: Dict[str, List[str]] = {}      # sido_code -> [sigungu_codes]
-        self._sigungu_index: Dict[str, List[str]] = {}   # sigungu_code -> [emd_codes]
+        self._sido_index: Dict[str, Set[str]] = {}       # sido_code -> {sigungu_codes}
+        self._sigungu_index: Dict[str, Set[str]] = {}    # sigungu_code -> {emd_codes}
+        # Sorted child views, re-sorted only after add_region touches a parent
+        self._sorted_children_cache: Dict[str, Tuple[str, ...]] = {}
+        self._children_dirty: Set[str] = set()
         self._initialize_sido()
     
     def _initialize_sido(self) -> None:
@@ -132,7 +135,7 @@ class KIKcdHierarchy:
                 is_active=True
             )
             self._regions[full_code] = region
-            self._sido_index[full_code] = []
+            self._sido_index[full_code] = set()
     
     def parse_code(self, code: str) -> Tuple[AdminLevel, str, str, str]:
         """
@@ -186,16 +189,26 @@ class KIKcdHierarchy:
             return None  # Sido has no parent (except national)
         return None
     
-    def get_children_codes(self, code: str) -> List[str]:
-        """Get all direct children region codes"""
-        normalized = self.normalize_code(code, self._get_level(code))
+    def get_children_codes(self, code: str) -> Tuple[str, ...]:
+        """Get all direct children region codes (sorted)"""
         level = self._get_level(code)
+        normalized = self.normalize_code(code, level)
         
         if level == AdminLevel.SIDO:
-            return self._sido_index.get(normalized, [])
+            index = self._sido_index
         elif level == AdminLevel.SIGUNGU:
-            return self._sigungu_index.get(normalized, [])
-        return []
+            index = self._sigungu_index
+        else:
+            return ()
+        
+        cached = self._sorted_children_cache.get(normalized)
+        if cached is not None and normalized not in self._children_dirty:
+            return cached
+        
+        cached = tuple(sorted(index.get(normalized, ())))
+        self._sorted_children_cache[normalized] = cached
+        self._children_dirty.discard(normalized)
+        return cached
     
     def _get_level(self, code: str) -> AdminLevel:
         """Determine the administrative level of a code"""
@@ -219,10 +232,8 @@ class KIKcdHierarchy:
             name_full = f"{sido_name} {name}"
             parent_code = sido_code
             # Index under sido
-            if sido_code not in self._sido_index:
-                self._sido_index[sido_code] = []
-            if code not in self._sido_index[sido_code]:
-                self._sido_index[sido_code].append(code)
+            self._sido_index.setdefault(sido_code, set()).add(code)
+            self._children_dirty.add(sido_code)
                 
         elif level == AdminLevel.EMD:
             sigungu_code = f"{sido}{sigungu}".ljust(10, '0')
@@ -231,10 +242,8 @@ class KIKcdHierarchy:
             name_full = f"{sido_name} {sigungu_name} {name}"
             parent_code = sigungu_code
             # Index under sigungu
-            if sigungu_code not in self._sigungu_index:
-                self._sigungu_index[sigungu_code] = []
-            if code not in self._sigungu_index[sigungu_code]:
-                self._sigungu_index[sigungu_code].append(code)
+            self._sigungu_index.setdefault(sigungu_code, set()).add(code)
+            self._children_dirty.add(sigungu_code)
         else:
             name_full = name
             parent_code = None
@@ -335,13 +344,15 @@ class KIKcdHierarchy:
         breadcrumb = []
         current = self.get_region(code)
         
+        # Walk leaf -> root with O(1) appends, then flip once
         while current:
-            breadcrumb.insert(0, current)
+            breadcrumb.append(current)
             if current.parent_code:
                 current = self.get_region(current.parent_code)
             else:
                 break
-                
+        
+        breadcrumb.reverse()
         return breadcrumb
     
     def search_by_name(self, query: str, level: Optional[AdminLevel] = None) -> List[Region]:
@@ -14,12 +14,21 @@ Age Clusters:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple, Union
 from enum import Enum
+import re
+import random
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; aggregation falls back to np.add.at
+    njit = None
+
 
 class WelfareCluster(Enum):
     """Welfare-centric demographic clusters"""
@@ -28,43 +37,67 @@ class WelfareCluster(Enum):
     YOUNG_OLD = "young_old"                 # 65-74
     OLD_OLD = "old_old"                     # 75+
     
-    @property
-    def age_range(self) -> Tuple[int, int]:
-        """Return (min_age, max_age) for this cluster"""
-        ranges = {
-            "children_youth": (0, 18),
-            "productive": (19, 64),
-            "young_old": (65, 74),
-            "old_old": (75, 120),
-        }
-        return ranges[self.value]
-    
-    @property
-    def korean_name(self) -> str:
-        """Korean display name"""
-        names = {
-            "children_youth": "아동·청소년",
-            "productive": "생산가능인구",
-            "young_old": "전기고령",
-            "old_old": "후기고령",
-        }
-        return names[self.value]
-    
-    @property
-    def focus_area(self) -> str:
-        """Primary welfare focus for this cluster"""
-        focus = {
-            "children_youth": "발달 및 보호",
-            "productive": "고용 및 가족지원",
-            "young_old": "사회참여 활성화",
-            "old_old": "집중돌봄",
-        }
-        return focus[self.value]
+    # Attached once below; plain attributes instead of per-access dict literals
+    age_range: Tuple[int, int]       # (min_age, max_age)
+    korean_name: str                 # Korean display name
+    focus_area: str                  # Primary welfare focus
+
+
+_CLUSTER_META = {
+    WelfareCluster.CHILDREN_YOUTH: ((0, 18), "아동·청소년", "발달 및 보호"),
+    WelfareCluster.PRODUCTIVE: ((19, 64), "생산가능인구", "고용 및 가족지원"),
+    WelfareCluster.YOUNG_OLD: ((65, 74), "전기고령", "사회참여 활성화"),
+    WelfareCluster.OLD_OLD: ((75, 120), "후기고령", "집중돌봄"),
+}
+for _cluster, (_range, _korean, _focus) in _CLUSTER_META.items():
+    _cluster.age_range, _cluster.korean_name, _cluster.focus_area = _range, _korean, _focus
+del _cluster, _range, _korean, _focus
+
 
+# Cluster boundaries as parallel arrays, in WelfareCluster declaration order
+CLUSTER_VALUES = tuple(c.value for c in WelfareCluster)
+CLUSTER_MIN = np.array([c.age_range[0] for c in WelfareCluster], dtype=np.int64)
+CLUSTER_MAX = np.array([c.age_range[1] for c in WelfareCluster], dtype=np.int64)
 
-@dataclass
+# Integer population columns of DemographicData, in export order
+POPULATION_FIELDS = (
+    'total_population', 'male_population', 'female_population',
+    'children_youth', 'productive', 'young_old', 'old_old',
+)
+
+
+def _percent(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise numerator / denominator * 100, with 0 where denominator is 0"""
+    out = np.zeros(numerator.shape, dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return (out * 100).astype(np.float32)
+
+
+def _scatter_add_numpy(group_idx: np.ndarray, gender_idx: np.ndarray,
+                       weighted: np.ndarray, out: np.ndarray) -> None:
+    """out[group, gender, :] += weighted row, unbuffered over repeated indices"""
+    np.add.at(out, (group_idx, gender_idx), weighted)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _scatter_add(group_idx, gender_idx, weighted, out):
+        """Compiled scatter-add of weighted cluster rows into (group, gender, cluster)"""
+        for i in range(weighted.shape[0]):
+            for c in range(weighted.shape[1]):
+                out[group_idx[i], gender_idx[i], c] += weighted[i, c]
+else:
+    _scatter_add = _scatter_add_numpy
+
+
+@dataclass(slots=True)
 class DemographicData:
-    """Container for processed demographic data"""
+    """
+    Container for processed demographic data
+    
+    Derived ratios are stored fields, computed by finalize(). Construction
+    finalizes automatically; call finalize() again after mutating counts.
+    """
     region_code: str
     region_name: str
     year: int
@@ -87,45 +120,35 @@ class DemographicData:
     # Age detail (5-year groups)
     age_distribution: Dict[str, int] = field(default_factory=dict)
     
+    # Derived ratios (percent), filled by finalize()
+    aging_ratio: float = field(default=0.0, init=False)        # elderly / total
+    old_old_ratio: float = field(default=0.0, init=False)      # 75+ / 65+
+    dependency_ratio: float = field(default=0.0, init=False)   # (children + elderly) / productive
+    youth_ratio: float = field(default=0.0, init=False)        # children / total
+    gender_ratio: float = field(default=0.0, init=False)       # male / female
+    
+    def __post_init__(self) -> None:
+        self.finalize()
+    
     @property
     def elderly_total(self) -> int:
         """Total elderly (65+)"""
         return self.young_old + self.old_old
     
-    @property
-    def aging_ratio(self) -> float:
-        """Aging ratio: elderly / total * 100"""
-        if self.total_population == 0:
-            return 0.0
-        return (self.elderly_total / self.total_population) * 100
-    
-    @property
-    def old_old_ratio(self) -> float:
-        """Old-Old ratio among elderly: 75+ / 65+ * 100"""
-        if self.elderly_total == 0:
-            return 0.0
-        return (self.old_old / self.elderly_total) * 100
-    
-    @property
-    def dependency_ratio(self) -> float:
-        """Dependency ratio: (children + elderly) / productive * 100"""
-        if self.productive == 0:
-            return 0.0
-        return ((self.children_youth + self.elderly_total) / self.productive) * 100
-    
-    @property
-    def youth_ratio(self) -> float:
-        """Youth ratio: children / total * 100"""
-        if self.total_population == 0:
-            return 0.0
-        return (self.children_youth / self.total_population) * 100
-    
-    @property
-    def gender_ratio(self) -> float:
-        """Gender ratio: male / female * 100"""
-        if self.female_population == 0:
-            return 0.0
-        return (self.male_population / self.female_population) * 100
+    def finalize(self) -> None:
+        """Recompute the derived ratio fields from the current counts"""
+        total = self.total_population
+        elderly = self.young_old + self.old_old
+        
+        self.aging_ratio = (elderly / total) * 100 if total else 0.0
+        self.old_old_ratio = (self.old_old / elderly) * 100 if elderly else 0.0
+        self.dependency_ratio = (
+            ((self.children_youth + elderly) / self.productive) * 100 if self.productive else 0.0
+        )
+        self.youth_ratio = (self.children_youth / total) * 100 if total else 0.0
+        self.gender_ratio = (
+            (self.male_population / self.female_population) * 100 if self.female_population else 0.0
+        )
 
 
 class DemographicProcessor:
@@ -150,10 +173,18 @@ class DemographicProcessor:
         r'^(\d+)\+$': lambda m: (int(m.group(1)), 120),
     }
     
+    # Compiled once at import; _parse_age_group walks this list per row
+    _COMPILED_AGE_PATTERNS = [(re.compile(p), fn) for p, fn in AGE_PATTERNS.items()]
+    
     # Columns to exclude (totals, subtotals)
     EXCLUDE_PATTERNS = [
         '계', '합계', '소계', '총계', '전체', 'Total', 'total'
     ]
+    _EXCLUDE_RE = re.compile('|'.join(map(re.escape, EXCLUDE_PATTERNS)))
+    
+    # Gender labels; anything else is treated as a total row
+    MALE_LABELS = ['남', 'male', 'Male', 'M']
+    FEMALE_LABELS = ['여', 'female', 'Female', 'F']
     
     def __init__(self, analysis_years: List[int] = None):
         """
@@ -165,49 +196,39 @@ class DemographicProcessor:
         self.analysis_years = analysis_years or list(range(2021, 2026))
         self._cache: Dict[str, DemographicData] = {}
     
-    def _parse_age_group(self, age_str: str) -> Optional[Tuple[int, int]]:
-        """Parse age group string to (min, max) tuple"""
-        import re
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_age_group(age_str: str) -> Optional[Tuple[int, int]]:
+        """
+        Parse age group string to (min, max) tuple
         
+        Memoized: KOSIS repeats the same handful of age labels on every row.
+        """
         age_str = str(age_str).strip()
         
-        for pattern, extractor in self.AGE_PATTERNS.items():
-            match = re.match(pattern, age_str)
+        for pattern, extractor in DemographicProcessor._COMPILED_AGE_PATTERNS:
+            match = pattern.match(age_str)
             if match:
                 return extractor(match)
         
         return None
     
-    def _classify_to_cluster(self, min_age: int, max_age: int) -> List[Tuple[WelfareCluster, float]]:
+    def _classify_to_cluster(self, min_age, max_age) -> np.ndarray:
         """
         Classify an age range to welfare clusters with proportional weights
         
-        Returns list of (cluster, proportion) for overlapping ranges
+        Returns a dense weight vector indexed in WelfareCluster order (shape (4,)).
+        Column arrays of ages, shape (n, 1), yield one weight row per range.
         """
-        results = []
-        
-        for cluster in WelfareCluster:
-            c_min, c_max = cluster.age_range
-            
-            # Calculate overlap
-            overlap_min = max(min_age, c_min)
-            overlap_max = min(max_age, c_max)
-            
-            if overlap_min <= overlap_max:
-                # There is overlap
-                overlap_range = overlap_max - overlap_min + 1
-                total_range = max_age - min_age + 1
-                proportion = overlap_range / total_range
-                results.append((cluster, proportion))
-        
-        return results
+        overlap_min = np.maximum(min_age, CLUSTER_MIN)
+        overlap_max = np.minimum(max_age, CLUSTER_MAX)
+        return np.clip(overlap_max - overlap_min + 1, 0, None) / (max_age - min_age + 1)
     
     def _is_total_entry(self, value: str) -> bool:
         """Check if value is a total/subtotal entry to exclude"""
         if pd.isna(value):
             return False
-        value_str = str(value).strip()
-        return any(pattern in value_str for pattern in self.EXCLUDE_PATTERNS)
+        return self._EXCLUDE_RE.search(str(value)) is not None
     
     def process_kosis_dataframe(self, df: pd.DataFrame, 
                                  region_col: str = 'C1_NM',
@@ -242,87 +263,103 @@ class DemographicProcessor:
         if region_col not in cols and 'C1_NM' in cols: region_col = 'C1_NM'
         if year_col not in cols and 'PRD_DE' in cols: year_col = 'PRD_DE'
         
-        # Filter out total entries
-        # Use a more lenient filter for KOSIS data
-        df_filtered = df.copy()
-        
-        # Group by region and year
-        for (region_code, year_full), group in df_filtered.groupby([region_code_col, year_col]):
-            # Extract year from PRD_DE (YYYYMM)
-            year = int(str(year_full)[:4])
-            if year not in self.analysis_years:
-                continue
-                
-            region_code = str(region_code).ljust(10, '0')[:10]
-            region_name = group[region_col].iloc[0] if len(group) > 0 else ""
-            
-            # Skip if region name is a total pattern
-            if self._is_total_entry(region_name):
-                continue
+        if gender_col not in cols:
+            gender_col = None
+        
+        # groupby() silently drops rows with missing keys; do the same up front
+        df = df.dropna(subset=[region_code_col, year_col])
+        if df.empty:
+            return results
+        
+        # One pass over the keys: every row gets its (region, period) group id
+        grouper = df.groupby([region_code_col, year_col], sort=True, observed=True)
+        group_ids = grouper.ngroup().to_numpy()
+        group_keys = list(grouper.groups.keys())
+        _, first_rows = np.unique(group_ids, return_index=True)
+        group_names = df[region_col].to_numpy()[first_rows]
+        
+        group_years = np.array([int(str(year_full)[:4]) for _, year_full in group_keys])
+        group_codes = (pd.Series([code for code, _ in group_keys]).astype('string')
+                       .str.pad(10, side='right', fillchar='0').str.slice(0, 10).tolist())
+        is_total = pd.Series(group_names).astype(str).str.contains(self._EXCLUDE_RE, na=False)
+        valid_groups = np.isin(group_years, self.analysis_years) & ~is_total.to_numpy(dtype=bool)
+        if not valid_groups.any():
+            return results
+        
+        # Parse each distinct age label once, then broadcast to rows
+        age_labels = df[age_col].astype(str)
+        age_idx, uniq_ages = pd.factorize(age_labels)
+        parsed = [self._parse_age_group(a) for a in uniq_ages]
+        age_ok = np.array([p is not None for p in parsed], dtype=bool)
+        min_age = np.array([p[0] if p else 0 for p in parsed], dtype=np.int64)
+        max_age = np.array([p[1] if p else 0 for p in parsed], dtype=np.int64)
+        
+        # Proportional cluster overlap per distinct age label: (n_ages, 4)
+        age_weights = self._classify_to_cluster(min_age[:, None], max_age[:, None])
+        # Most 5-year labels sit wholly inside one cluster (weight exactly 1.0)
+        single_cluster = np.where((age_weights == 1.0).any(axis=1), age_weights.argmax(axis=1), -1)
+        
+        row_mask = valid_groups[group_ids] & age_ok[age_idx]
+        rows_gid = group_ids[row_mask]
+        rows_age = age_idx[row_mask]
+        pop = pd.to_numeric(df[population_col], errors='coerce').fillna(0).to_numpy()[row_mask]
+        # Per-row counts fit int32; only the accumulators below need int64
+        pop_int = np.trunc(pop).astype(np.int32)
+        
+        if gender_col is not None:
+            genders = df[gender_col].astype(str)[row_mask]
+            gender_idx = np.where(
+                genders.isin(self.MALE_LABELS), 0,
+                np.where(genders.isin(self.FEMALE_LABELS), 1, 2)
+            )
+        else:
+            gender_idx = np.full(len(pop), 2)
+        
+        # Single-cluster rows are a plain integer placement; only labels that
+        # straddle a boundary go through int(pop * weight) truncation
+        weighted = np.zeros((len(pop), len(CLUSTER_VALUES)), dtype=np.int32)
+        rows_cluster = single_cluster[rows_age]
+        single = rows_cluster >= 0
+        weighted[single, rows_cluster[single]] = pop_int[single]
+        split = ~single
+        if split.any():
+            weighted[split] = np.trunc(pop[split, None] * age_weights[rows_age[split]])
+        
+        # All (group, gender) cluster sums in one dense scatter-add
+        cluster_sums = np.zeros((len(group_keys), 3, len(CLUSTER_VALUES)), dtype=np.int64)
+        _scatter_add(rows_gid, gender_idx, weighted, cluster_sums)
+        
+        # Age distribution keeps the first-seen order of labels within a group
+        age_sums = pd.Series(pop_int, dtype=np.int64).groupby([rows_gid, rows_age], sort=False).sum()
+        age_distributions: Dict[int, Dict[str, int]] = {}
+        for (gid, aid), value in zip(age_sums.index.tolist(), age_sums.tolist()):
+            age_distributions.setdefault(gid, {})[uniq_ages[aid]] = value
+        
+        for gid in np.flatnonzero(valid_groups).tolist():
+            region_code = group_codes[gid]
+            year = int(group_years[gid])
+            male, female, total = cluster_sums[gid].tolist()
             
             demo = DemographicData(
                 region_code=region_code,
-                region_name=region_name,
+                region_name=group_names[gid],
                 year=year,
-                male_by_cluster={c.value: 0 for c in WelfareCluster},
-                female_by_cluster={c.value: 0 for c in WelfareCluster},
-                age_distribution={}
+                total_population=sum(total),
+                male_population=sum(male),
+                female_population=sum(female),
+                male_by_cluster=dict(zip(CLUSTER_VALUES, male)),
+                female_by_cluster=dict(zip(CLUSTER_VALUES, female)),
+                age_distribution=age_distributions.get(gid, {}),
             )
-            
-            # Process each age/gender combination
-            for _, row in group.iterrows():
-                age_str = str(row[age_col])
-                gender = str(row[gender_col]) if gender_col in row else "계"
-                pop = int(row[population_col]) if pd.notna(row[population_col]) else 0
-                
-                # Parse age range
-                age_range = self._parse_age_group(age_str)
-                if age_range is None:
-                    continue
-                
-                min_age, max_age = age_range
-                
-                # Store in age distribution
-                demo.age_distribution[age_str] = demo.age_distribution.get(age_str, 0) + pop
-                
-                # Classify to welfare clusters
-                cluster_weights = self._classify_to_cluster(min_age, max_age)
-                
-                for cluster, weight in cluster_weights:
-                    weighted_pop = int(pop * weight)
-                    
-                    if gender in ['남', 'male', 'Male', 'M']:
-                        demo.male_by_cluster[cluster.value] += weighted_pop
-                        demo.male_population += weighted_pop
-                    elif gender in ['여', 'female', 'Female', 'F']:
-                        demo.female_by_cluster[cluster.value] += weighted_pop
-                        demo.female_population += weighted_pop
-                    else:  # Total or unspecified
-                        # Add to cluster totals
-                        if cluster == WelfareCluster.CHILDREN_YOUTH:
-                            demo.children_youth += weighted_pop
-                        elif cluster == WelfareCluster.PRODUCTIVE:
-                            demo.productive += weighted_pop
-                        elif cluster == WelfareCluster.YOUNG_OLD:
-                            demo.young_old += weighted_pop
-                        elif cluster == WelfareCluster.OLD_OLD:
-                            demo.old_old += weighted_pop
-                        demo.total_population += weighted_pop
+            demo.children_youth, demo.productive, demo.young_old, demo.old_old = total
             
             # If we only have gender-specific data, compute totals
             if demo.total_population == 0 and (demo.male_population > 0 or demo.female_population > 0):
                 demo.total_population = demo.male_population + demo.female_population
-                for cluster in WelfareCluster:
-                    cluster_total = (demo.male_by_cluster.get(cluster.value, 0) + 
-                                   demo.female_by_cluster.get(cluster.value, 0))
-                    if cluster == WelfareCluster.CHILDREN_YOUTH:
-                        demo.children_youth = cluster_total
-                    elif cluster == WelfareCluster.PRODUCTIVE:
-                        demo.productive = cluster_total
-                    elif cluster == WelfareCluster.YOUNG_OLD:
-                        demo.young_old = cluster_total
-                    elif cluster == WelfareCluster.OLD_OLD:
-                        demo.old_old = cluster_total
+                (demo.children_youth, demo.productive,
+                 demo.young_old, demo.old_old) = [m + f for m, f in zip(male, female)]
+            
+            demo.finalize()
             
             # Store result
             if region_code not in results:
@@ -337,45 +374,46 @@ class DemographicProcessor:
         
         Generates realistic 5-year trend data showing aging patterns.
         """
-        import random
-        
         base_population = random.randint(30000, 500000)
-        data = {}
         
-        for i, year in enumerate(self.analysis_years):
-            # Simulate aging trend
-            aging_factor = 1 + (i * 0.02)  # 2% annual increase in elderly
-            youth_factor = 1 - (i * 0.015)  # 1.5% annual decrease in youth
-            
-            demo = DemographicData(
+        # Whole trend in one vectorized pass over the year index
+        i = np.arange(len(self.analysis_years))
+        aging_factor = 1 + (i * 0.02)  # 2% annual increase in elderly
+        youth_factor = 1 - (i * 0.015)  # 1.5% annual decrease in youth
+        
+        total = (base_population * (1 - i * 0.005)).astype(np.int64)
+        clusters = np.column_stack([
+            base_population * 0.15 * youth_factor,
+            base_population * 0.65 * (1 - i * 0.01),
+            base_population * 0.12 * aging_factor,
+            base_population * 0.08 * (aging_factor ** 1.5),
+        ]).astype(np.int64)
+        
+        # Add gender split (roughly 48:52 M:F for elderly)
+        male = (total * 0.49).astype(np.int64)
+        male_clusters = (clusters * np.array([0.51, 0.50, 0.45, 0.38])).astype(np.int64)
+        female_clusters = clusters - male_clusters
+        
+        data = {}
+        for year, total_y, male_y, cluster_y, male_c, female_c in zip(
+            self.analysis_years, total.tolist(), male.tolist(), clusters.tolist(),
+            male_clusters.tolist(), female_clusters.tolist()
+        ):
+            children_youth, productive, young_old, old_old = cluster_y
+            data[year] = DemographicData(
                 region_code=region_code,
                 region_name=region_name,
                 year=year,
-                total_population=int(base_population * (1 - i * 0.005)),
-                children_youth=int(base_population * 0.15 * youth_factor),
-                productive=int(base_population * 0.65 * (1 - i * 0.01)),
-                young_old=int(base_population * 0.12 * aging_factor),
-                old_old=int(base_population * 0.08 * (aging_factor ** 1.5)),
+                total_population=total_y,
+                male_population=male_y,
+                female_population=total_y - male_y,
+                children_youth=children_youth,
+                productive=productive,
+                young_old=young_old,
+                old_old=old_old,
+                male_by_cluster=dict(zip(CLUSTER_VALUES, male_c)),
+                female_by_cluster=dict(zip(CLUSTER_VALUES, female_c)),
             )
-            
-            # Add gender split (roughly 48:52 M:F for elderly)
-            demo.male_population = int(demo.total_population * 0.49)
-            demo.female_population = demo.total_population - demo.male_population
-            
-            demo.male_by_cluster = {
-                WelfareCluster.CHILDREN_YOUTH.value: int(demo.children_youth * 0.51),
-                WelfareCluster.PRODUCTIVE.value: int(demo.productive * 0.50),
-                WelfareCluster.YOUNG_OLD.value: int(demo.young_old * 0.45),
-                WelfareCluster.OLD_OLD.value: int(demo.old_old * 0.38),
-            }
-            demo.female_by_cluster = {
-                WelfareCluster.CHILDREN_YOUTH.value: demo.children_youth - demo.male_by_cluster[WelfareCluster.CHILDREN_YOUTH.value],
-                WelfareCluster.PRODUCTIVE.value: demo.productive - demo.male_by_cluster[WelfareCluster.PRODUCTIVE.value],
-                WelfareCluster.YOUNG_OLD.value: demo.young_old - demo.male_by_cluster[WelfareCluster.YOUNG_OLD.value],
-                WelfareCluster.OLD_OLD.value: demo.old_old - demo.male_by_cluster[WelfareCluster.OLD_OLD.value],
-            }
-            
-            data[year] = demo
         
         return data
     
@@ -386,61 +424,66 @@ class DemographicProcessor:
         
         Example: Aggregate all Sigungu data to Sido level
         """
-        aggregated = {}
+        years = self.analysis_years
+        fields_of = attrgetter(*POPULATION_FIELDS)
         
-        for year in self.analysis_years:
-            demo = DemographicData(
+        # Stack children into (child, year, field) arrays, then reduce once
+        totals = np.zeros((len(children_data), len(years), len(POPULATION_FIELDS)), dtype=np.int64)
+        male = np.zeros((len(children_data), len(years), len(CLUSTER_VALUES)), dtype=np.int64)
+        female = np.zeros_like(male)
+        
+        for c, child_data in enumerate(children_data):
+            for y, year in enumerate(years):
+                child = child_data.get(year)
+                if child is None:
+                    continue
+                totals[c, y] = fields_of(child)
+                male[c, y] = [child.male_by_cluster.get(v, 0) for v in CLUSTER_VALUES]
+                female[c, y] = [child.female_by_cluster.get(v, 0) for v in CLUSTER_VALUES]
+        
+        totals = totals.sum(axis=0).tolist()
+        male = male.sum(axis=0).tolist()
+        female = female.sum(axis=0).tolist()
+        
+        aggregated = {}
+        for y, year in enumerate(years):
+            aggregated[year] = DemographicData(
                 region_code=parent_code,
                 region_name=parent_name,
                 year=year,
-                male_by_cluster={c.value: 0 for c in WelfareCluster},
-                female_by_cluster={c.value: 0 for c in WelfareCluster},
+                male_by_cluster=dict(zip(CLUSTER_VALUES, male[y])),
+                female_by_cluster=dict(zip(CLUSTER_VALUES, female[y])),
+                **dict(zip(POPULATION_FIELDS, totals[y])),
             )
-            
-            for child_data in children_data:
-                if year in child_data:
-                    child = child_data[year]
-                    demo.total_population += child.total_population
-                    demo.male_population += child.male_population
-                    demo.female_population += child.female_population
-                    demo.children_youth += child.children_youth
-                    demo.productive += child.productive
-                    demo.young_old += child.young_old
-                    demo.old_old += child.old_old
-                    
-                    for cluster in WelfareCluster:
-                        demo.male_by_cluster[cluster.value] += child.male_by_cluster.get(cluster.value, 0)
-                        demo.female_by_cluster[cluster.value] += child.female_by_cluster.get(cluster.value, 0)
-            
-            aggregated[year] = demo
         
         return aggregated
     
     def to_dataframe(self, data: Dict[str, Dict[int, DemographicData]]) -> pd.DataFrame:
         """Convert processed data to pandas DataFrame"""
-        records = []
-        
-        for region_code, years_data in data.items():
-            for year, demo in years_data.items():
-                records.append({
-                    'region_code': demo.region_code,
-                    'region_name': demo.region_name,
-                    'year': demo.year,
-                    'total_population': demo.total_population,
-                    'male_population': demo.male_population,
-                    'female_population': demo.female_population,
-                    'children_youth': demo.children_youth,
-                    'productive': demo.productive,
-                    'young_old': demo.young_old,
-                    'old_old': demo.old_old,
-                    'elderly_total': demo.elderly_total,
-                    'aging_ratio': demo.aging_ratio,
-                    'old_old_ratio': demo.old_old_ratio,
-                    'dependency_ratio': demo.dependency_ratio,
-                    'youth_ratio': demo.youth_ratio,
-                })
-        
-        return pd.DataFrame(records)
+        demos = [demo for years_data in data.values() for demo in years_data.values()]
+        n = len(demos)
+        
+        # Fill each column in one typed pass instead of a list of row dicts
+        columns = {
+            'region_code': np.array([d.region_code for d in demos], dtype=object),
+            'region_name': np.array([d.region_name for d in demos], dtype=object),
+            'year': np.fromiter((d.year for d in demos), dtype=np.int16, count=n),
+        }
+        for name in POPULATION_FIELDS:
+            columns[name] = np.fromiter((getattr(d, name) for d in demos), dtype=np.int64, count=n)
+        
+        total = columns['total_population']
+        children = columns['children_youth']
+        productive = columns['productive']
+        elderly = columns['young_old'] + columns['old_old']
+        
+        columns['elderly_total'] = elderly
+        columns['aging_ratio'] = _percent(elderly, total)
+        columns['old_old_ratio'] = _percent(columns['old_old'], elderly)
+        columns['dependency_ratio'] = _percent(children + elderly, productive)
+        columns['youth_ratio'] = _percent(children, total)
+        
+        return pd.DataFrame(columns)
     
     def get_cluster_summary(self, demo: DemographicData) -> Dict[str, dict]:
         """Get detailed summary for each welfare cluster"""
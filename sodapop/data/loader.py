@@ -10,15 +10,17 @@ Implements Zero-Inertia principle by automatic filtering and preprocessing.
 """
 
 import os
+import re
 import json
 from typing import Dict, List, Optional, Union
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import pyarrow.csv as pacsv
 from datetime import datetime
 
 from sodapop.core.hierarchy import KIKcdHierarchy, AdminLevel
-from sodapop.core.processor import DemographicProcessor, DemographicData
+from sodapop.core.processor import DemographicProcessor, DemographicData, POPULATION_FIELDS
 
 
 class KOSISDataLoader:
@@ -59,6 +61,17 @@ class KOSISDataLoader:
             "pop": "population",
         }
     }
+    _MAPPING_KEYSETS = {name: frozenset(mapping) for name, mapping in COLUMN_MAPPINGS.items()}
+    
+    # DemographicData fields persisted by the cache, in constructor order
+    CACHE_COLUMNS = ('region_code', 'region_name', 'year') + POPULATION_FIELDS
+    
+    # Substrings marking aggregate ("계") rows, matched in one regex pass
+    REGION_TOTAL_PATTERNS = ['계', '소계', '합계', '전국', '전체']
+    AGE_TOTAL_PATTERNS = ['계', '합계', '전체']
+    # Kept as pattern strings: Arrow-backed columns reject compiled re objects
+    _REGION_TOTAL_RE = '|'.join(map(re.escape, REGION_TOTAL_PATTERNS))
+    _AGE_TOTAL_RE = '|'.join(map(re.escape, AGE_TOTAL_PATTERNS))
     
     def __init__(self, data_dir: Optional[str] = None, api_key: Optional[str] = None):
         """
@@ -88,16 +101,19 @@ class KOSISDataLoader:
         Returns:
             Preprocessed pandas DataFrame
         """
-        df = pd.read_csv(filepath, encoding=encoding)
+        # Multithreaded Arrow parser; columns stay Arrow-backed in pandas
+        table = pacsv.read_csv(filepath, read_options=pacsv.ReadOptions(encoding=encoding))
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
         
         # Apply column mapping
         if column_mapping:
             df = df.rename(columns=column_mapping)
         else:
             # Try to detect and apply standard mapping
-            for mapping_type, mapping in self.COLUMN_MAPPINGS.items():
-                if set(mapping.keys()).intersection(df.columns):
-                    df = df.rename(columns=mapping)
+            columns = frozenset(df.columns)
+            for mapping_type, keys in self._MAPPING_KEYSETS.items():
+                if keys & columns:
+                    df = df.rename(columns=self.COLUMN_MAPPINGS[mapping_type])
                     break
         
         # Preprocess
@@ -176,32 +192,40 @@ class KOSISDataLoader:
         
         - Filter out "계" (total) entries
         - Normalize region codes
-        - Convert data types
+        - Convert data types (categorical keys, compact year)
         - Handle missing values
         """
-        # Filter out total entries
+        # Filter out total entries with a single combined mask
+        is_total = pd.Series(False, index=df.index)
         if 'region' in df.columns:
-            total_patterns = ['계', '소계', '합계', '전국', '전체']
-            for pattern in total_patterns:
-                df = df[~df['region'].str.contains(pattern, na=False)]
-        
+            is_total |= df['region'].str.contains(self._REGION_TOTAL_RE, na=False)
         if 'age_group' in df.columns:
-            df = df[~df['age_group'].str.contains('계|합계|전체', na=False)]
+            is_total |= df['age_group'].str.contains(self._AGE_TOTAL_RE, na=False)
+        df = df.loc[~is_total].copy()
         
         # Normalize region codes to 10 digits
         if 'region_code' in df.columns:
-            df['region_code'] = df['region_code'].astype(str).str.ljust(10, '0').str[:10]
+            df['region_code'] = (df['region_code'].astype('string')
+                                 .str.pad(10, side='right', fillchar='0').str.slice(0, 10))
         
-        # Convert year to int
+        # Convert year to int (Int16 when it fits; YYYYMM periods stay Int64)
         if 'year' in df.columns:
-            df['year'] = pd.to_numeric(df['year'], errors='coerce').astype('Int64')
+            year = pd.to_numeric(df['year'], errors='coerce')
+            ymax = year.max()  # NA when the column is empty or all-missing
+            fits = pd.notna(ymax) and ymax <= np.iinfo(np.int16).max
+            df['year'] = year.astype('Int16' if fits else 'Int64')
         
-        # Convert population to int
+        # Convert population to int32 (counts fit; halves groupby/sum bandwidth)
         if 'population' in df.columns:
             df['population'] = pd.to_numeric(
                 df['population'].astype(str).str.replace(',', ''), 
                 errors='coerce'
-            ).fillna(0).astype(int)
+            ).fillna(0).astype(np.int32)
+        
+        # Low-cardinality keys as categoricals: groupby/isin hash small int codes
+        for col in ('region_code', 'gender', 'age_group'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
         
         return df
     
@@ -216,7 +240,15 @@ class KOSISDataLoader:
         Returns:
             Dict[region_code, Dict[year, DemographicData]]
         """
-        return self.processor.process_kosis_dataframe(df)
+        return self.processor.process_kosis_dataframe(
+            df,
+            region_col='region',
+            region_code_col='region_code',
+            year_col='year',
+            age_col='age_group',
+            gender_col='gender',
+            population_col='population',
+        )
     
     def generate_sample_data(self, n_regions: int = 20) -> Dict[str, Dict[int, DemographicData]]:
         """
@@ -250,58 +282,79 @@ class KOSISDataLoader:
         return all_data
     
     def save_to_cache(self, data: Dict[str, Dict[int, DemographicData]], 
-                      cache_name: str = "processed_data") -> str:
+                      cache_name: str = "processed_data",
+                      cache_format: str = "parquet") -> str:
         """
         Save processed data to cache file
         
+        Parquet (zstd, columnar) by default; cache_format="json" writes the
+        legacy human-readable file for debugging.
+        
         Returns path to cached file.
         """
         cache_dir = self.data_dir / "cache"
         cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Convert to serializable format
+        if cache_format == "json":
+            return self._save_json_cache(data, cache_dir / f"{cache_name}.json")
+        
+        filepath = cache_dir / f"{cache_name}.parquet"
+        df = self.processor.to_dataframe(data)[list(self.CACHE_COLUMNS)]
+        df.to_parquet(filepath, engine="pyarrow", compression="zstd", index=False)
+        
+        return str(filepath)
+    
+    def load_from_cache(self, cache_name: str = "processed_data",
+                        cache_format: str = "parquet") -> Dict[str, Dict[int, DemographicData]]:
+        """
+        Load processed data from cache file
+        """
+        if cache_format == "json":
+            return self._load_json_cache(self.data_dir / "cache" / f"{cache_name}.json")
+        
+        filepath = self.data_dir / "cache" / f"{cache_name}.parquet"
+        
+        if not filepath.exists():
+            raise FileNotFoundError(f"Cache file not found: {filepath}")
+        
+        df = pd.read_parquet(filepath, engine="pyarrow", columns=list(self.CACHE_COLUMNS))
+        
+        # Convert back to DemographicData objects
+        data: Dict[str, Dict[int, DemographicData]] = {}
+        for row in df.itertuples(index=False, name=None):
+            demo = DemographicData(*row)
+            data.setdefault(demo.region_code, {})[demo.year] = demo
+        
+        return data
+    
+    def _save_json_cache(self, data: Dict[str, Dict[int, DemographicData]], filepath: Path) -> str:
+        """Write the legacy JSON cache format"""
         serializable = {}
         for code, years_data in data.items():
             serializable[code] = {}
             for year, demo in years_data.items():
                 serializable[code][str(year)] = {
-                    "region_code": demo.region_code,
-                    "region_name": demo.region_name,
-                    "year": demo.year,
-                    "total_population": demo.total_population,
-                    "male_population": demo.male_population,
-                    "female_population": demo.female_population,
-                    "children_youth": demo.children_youth,
-                    "productive": demo.productive,
-                    "young_old": demo.young_old,
-                    "old_old": demo.old_old,
+                    column: getattr(demo, column) for column in self.CACHE_COLUMNS
                 }
         
-        filepath = cache_dir / f"{cache_name}.json"
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(serializable, f, ensure_ascii=False, indent=2)
         
         return str(filepath)
     
-    def load_from_cache(self, cache_name: str = "processed_data") -> Dict[str, Dict[int, DemographicData]]:
-        """
-        Load processed data from cache file
-        """
-        filepath = self.data_dir / "cache" / f"{cache_name}.json"
-        
+    def _load_json_cache(self, filepath: Path) -> Dict[str, Dict[int, DemographicData]]:
+        """Read the legacy JSON cache format"""
         if not filepath.exists():
             raise FileNotFoundError(f"Cache file not found: {filepath}")
         
         with open(filepath, 'r', encoding='utf-8') as f:
             serializable = json.load(f)
         
-        # Convert back to DemographicData objects
         data = {}
         for code, years_data in serializable.items():
             data[code] = {}
             for year_str, demo_dict in years_data.items():
-                demo = DemographicData(**demo_dict)
-                data[code][int(year_str)] = demo
+                data[code][int(year_str)] = DemographicData(**demo_dict)
         
         return data
 
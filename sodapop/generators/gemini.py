@@ -8,21 +8,109 @@ Powered by Google Gemini for:
 """
 
 import os
+import json
+import asyncio
+import hashlib
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import numpy as np
 import google.generativeai as genai
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator, Iterator, Coroutine, TypeVar
 from sodapop.core.processor import DemographicData
 from sodapop.core.analyzer import TrendMetrics
 
+T = TypeVar("T")
+
+
+# Prompt templates (filled with str.format_map)
+_ANALYZE_PROMPT = """
+        당신은 대한민국 사회복지 분야의 데이터 분석 전문가입니다. 
+        다음 통계 데이터를 바탕으로 해당 지역의 인구학적 변화 추이를 분석하고, 
+        사회복지사가 사업 기획서에 즉시 활용할 수 있는 '복지 근거문(Rationale)'을 작성해 주세요.
+
+        지역: {region_name}
+        기준 연도: {year}
+        
+        통계 지표:
+        - 총인구: {total_population:,}명
+        - 고령화율: {aging_ratio:.1f}%
+        - 후기고령(75세 이상) 인구: {old_old:,}명 ({old_old_ratio:.1f}%)
+        - 고령화 속도: {aging_velocity:.1f}%/년
+        - 부양비: {dependency_ratio:.1f}%
+        
+        주요 위험 요인:
+        {risk_factors}
+        
+        형식:
+        1. [인구학적 추이 요약]: 현재 상태와 최근 추세를 전문가적 관점에서 요약.
+        2. [복지 Rationale]: 사업 계획서에 바로 사용할 수 있는 설득력 있는 문장.
+        3. [긴급 제언]: 가장 시급한 사회복지 서비스 1-2가지 추천.
+
+        언어: 한국어
+        분위기: 전문적, 논리적, 데이터 기반.
+        """
+
+_BATCH_PROMPT = """
+        당신은 대한민국 사회복지 분야의 데이터 분석 전문가입니다. 
+        아래 {count}개 지역 각각에 대해 인구학적 변화 추이를 분석하고, 
+        사회복지사가 사업 기획서에 즉시 활용할 수 있는 '복지 근거문(Rationale)'을 작성해 주세요.
+
+        {regions}
+        
+        각 지역마다 다음 JSON 객체 하나를 작성하고, 전체를 JSON 배열로만 응답하세요:
+        [{{"id": <REGION id>, "summary": "인구학적 추이 요약", "rationale": "복지 Rationale", "urgent": "긴급 제언 1-2가지"}}]
+
+        언어: 한국어
+        분위기: 전문적, 논리적, 데이터 기반.
+        """
+
+_QUERY_PROMPT = """
+        사용자가 지역 통계 데이터에 대해 다음과 같은 질문을 했습니다: "{query}"
+        
+        제공된 데이터 컨텍스트:
+        {context_data}
+        
+        데이터에 기반하여 정확하고 친절하게 답변해 주세요. 
+        만약 데이터에 없는 내용이라면 추측하지 말고 모른다고 답변하세요.
+        답변은 300자 이내로 간결하게 작성하세요.
+        """
+
+
 class GeminiAnalyzer:
     """
     AI Insight System for SODAPOP 2.0 using Google Gemini API.
+    
+    Calls are async (generate_content_async) so many regions can be analyzed
+    concurrently; the sync methods are thin asyncio.run() wrappers (run on a
+    worker thread when called from inside an event loop, e.g. Jupyter).
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Semantic cache for natural-language queries
+    EMBED_MODEL = "models/text-embedding-004"
+    SEMANTIC_THRESHOLD = 0.92  # cosine similarity above which a cached answer is reused
+    
+    def __init__(self, api_key: Optional[str] = None, concurrency_limit: int = 8,
+                 cache_size: int = 512, semantic_cache_dir: Optional[str] = None):
         """
         Initialize Gemini client.
+        
+        Args:
+            api_key: Gemini API key (default: GEMINI_API_KEY env var)
+            concurrency_limit: Max in-flight Gemini requests, to stay under QPM quota
+            cache_size: Max responses kept in the in-memory LRU cache
+            semantic_cache_dir: Directory to persist the query semantic cache (memory only if None)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+        self.concurrency_limit = concurrency_limit
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        # context hash -> (unit-normalized query embeddings (n, d), answers)
+        self._semantic: Dict[str, Tuple[np.ndarray, List[str]]] = {}
+        self.semantic_cache_dir = Path(semantic_cache_dir) if semantic_cache_dir else None
         if self.api_key:
             genai.configure(api_key=self.api_key)
             self.model = genai.GenerativeModel('gemini-1.5-flash')
@@ -30,66 +118,304 @@ class GeminiAnalyzer:
             self.model = None
             print("Warning: GEMINI_API_KEY not found.")
 
+    def _limiter(self) -> asyncio.Semaphore:
+        """Concurrency semaphore for the running event loop (one per loop)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency_limit)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    @staticmethod
+    def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+        """asyncio.run(coro), on a worker thread if this thread already runs a loop"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # asyncio.run() refuses to nest inside a running loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    @staticmethod
+    def _cache_key(prompt: str) -> str:
+        """Stable key for a prompt (the prompt already embeds the rounded metrics)"""
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a cached response and mark it most recently used"""
+        text = self._cache.get(key)
+        if text is not None:
+            self._cache.move_to_end(key)
+        return text
+
+    def _cache_put(self, key: str, text: str) -> None:
+        """Store a successful response, evicting the least recently used"""
+        self._cache[key] = text
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached responses (call after the underlying data is refreshed)"""
+        self._cache.clear()
+        self._semantic.clear()
+        
+        # Remove the persisted semantic caches too, or they would be reloaded on next use
+        if self.semantic_cache_dir is not None and self.semantic_cache_dir.is_dir():
+            for path in self.semantic_cache_dir.glob("query_*.npz"):
+                try:
+                    path.unlink()
+                except OSError as e:
+                    warnings.warn(f"Failed to delete semantic cache {path}: {e}")
+
+    async def _embed(self, text: str) -> np.ndarray:
+        """Unit-normalized embedding of a query"""
+        async with self._limiter():
+            result = await genai.embed_content_async(
+                model=self.EMBED_MODEL, content=text, task_type="semantic_similarity"
+            )
+        vector = np.asarray(result["embedding"], dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    def _semantic_entries(self, context_key: str) -> Tuple[np.ndarray, List[str]]:
+        """Cached (embeddings, answers) for a data context, loaded from disk on first use"""
+        entries = self._semantic.get(context_key)
+        if entries is None:
+            entries = (np.empty((0, 0), dtype=np.float32), [])
+            path = self._semantic_path(context_key)
+            if path is not None and path.exists():
+                try:
+                    with np.load(path, allow_pickle=False) as stored:
+                        entries = (stored["vectors"], stored["answers"].tolist())
+                except (OSError, ValueError, KeyError) as e:
+                    warnings.warn(f"Failed to load semantic cache {path}: {e}")
+            self._semantic[context_key] = entries
+        return entries
+
+    def _semantic_path(self, context_key: str) -> Optional[Path]:
+        """On-disk file for a context's semantic cache"""
+        if self.semantic_cache_dir is None:
+            return None
+        return self.semantic_cache_dir / f"query_{context_key}.npz"
+
+    def _semantic_lookup(self, context_key: str, embedding: np.ndarray) -> Optional[str]:
+        """Answer of the most similar cached query, if above SEMANTIC_THRESHOLD"""
+        vectors, answers = self._semantic_entries(context_key)
+        if not answers or vectors.shape[1] != embedding.shape[0]:
+            return None
+        similarity = vectors @ embedding
+        best = int(np.argmax(similarity))
+        return answers[best] if similarity[best] > self.SEMANTIC_THRESHOLD else None
+
+    def _semantic_add(self, context_key: str, embedding: np.ndarray, answer: str) -> None:
+        """Remember a query/answer pair (keeps the newest cache_size per context)"""
+        vectors, answers = self._semantic_entries(context_key)
+        if answers and vectors.shape[1] != embedding.shape[0]:
+            vectors, answers = vectors[:0], []
+        vectors = np.vstack([vectors.reshape(-1, embedding.shape[0]), embedding])[-self.cache_size:]
+        answers = (answers + [answer])[-self.cache_size:]
+        self._semantic[context_key] = (vectors, answers)
+        
+        path = self._semantic_path(context_key)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                np.savez(path, vectors=vectors, answers=np.array(answers, dtype=str))
+            except OSError as e:
+                warnings.warn(f"Failed to save semantic cache {path}: {e}")
+
+    async def _generate_cached(self, prompt: str) -> str:
+        """generate_content_async behind the LRU cache; errors propagate and are not cached"""
+        key = self._cache_key(prompt)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        async with self._limiter():
+            response = await self.model.generate_content_async(prompt)
+        self._cache_put(key, response.text)
+        return response.text
+
     def analyze_insight(self, data: DemographicData, metrics: TrendMetrics) -> str:
         """
         Generate a deep demographic insight and welfare rationale.
         """
-        if not self.model:
-            return "Gemini API 키가 설정되지 않았습니다. [AI/API 설정]에서 키를 등록해 주세요."
-            
-        prompt = f"""
-        당신은 대한민국 사회복지 분야의 데이터 분석 전문가입니다. 
-        다음 통계 데이터를 바탕으로 해당 지역의 인구학적 변화 추이를 분석하고, 
-        사회복지사가 사업 기획서에 즉시 활용할 수 있는 '복지 근거문(Rationale)'을 작성해 주세요.
+        return self._run_sync(self.analyze_insight_async(data, metrics))
+
+    async def analyze_insight_async(self, data: DemographicData, metrics: TrendMetrics) -> str:
+        """
+        Async version of analyze_insight (collects stream_insight into one string).
+        """
+        return "".join([chunk async for chunk in self.stream_insight(data, metrics)])
 
-        지역: {data.region_name}
-        기준 연도: {data.year}
+    async def stream_insight(self, data: DemographicData, metrics: TrendMetrics) -> AsyncIterator[str]:
+        """
+        Stream the insight text chunk by chunk as Gemini generates it.
         
-        통계 지표:
-        - 총인구: {data.total_population:,}명
-        - 고령화율: {data.aging_ratio:.1f}%
-        - 후기고령(75세 이상) 인구: {data.old_old:,}명 ({data.old_old_ratio:.1f}%)
-        - 고령화 속도: {metrics.aging_velocity:.1f}%/년
-        - 부양비: {data.dependency_ratio:.1f}%
+        A cached response is yielded as a single chunk; only complete
+        responses are cached.
+        """
+        if not self.model:
+            yield "Gemini API 키가 설정되지 않았습니다. [AI/API 설정]에서 키를 등록해 주세요."
+            return
         
-        주요 위험 요인:
-        {", ".join(metrics.urgency_factors)}
+        prompt = self._insight_prompt(data, metrics)
+        key = self._cache_key(prompt)
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached
+            return
         
-        형식:
-        1. [인구학적 추이 요약]: 현재 상태와 최근 추세를 전문가적 관점에서 요약.
-        2. [복지 Rationale]: 사업 계획서에 바로 사용할 수 있는 설득력 있는 문장.
-        3. [긴급 제언]: 가장 시급한 사회복지 서비스 1-2가지 추천.
+        chunks: List[str] = []
+        try:
+            async with self._limiter():
+                response = await self.model.generate_content_async(prompt, stream=True)
+                async for chunk in response:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+        except Exception as e:
+            yield ("\n\n" if chunks else "") + f"Gemini API 호출 중 오류가 발생했습니다: {e}"
+            return
+        self._cache_put(key, "".join(chunks))
 
-        언어: 한국어
-        분위기: 전문적, 논리적, 데이터 기반.
+    def iter_insight(self, data: DemographicData, metrics: TrendMetrics) -> Iterator[str]:
+        """
+        Sync iterator over stream_insight (e.g. for st.write_stream).
         """
+        loop = asyncio.new_event_loop()
+        stream = self.stream_insight(data, metrics)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(stream.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(stream.aclose())
+            loop.close()
+
+    @staticmethod
+    def _insight_prompt(data: DemographicData, metrics: TrendMetrics) -> str:
+        """Single-region insight prompt"""
+        return _ANALYZE_PROMPT.format_map({
+            "region_name": data.region_name,
+            "year": data.year,
+            "total_population": data.total_population,
+            "aging_ratio": data.aging_ratio,
+            "old_old": data.old_old,
+            "old_old_ratio": data.old_old_ratio,
+            "aging_velocity": metrics.aging_velocity,
+            "dependency_ratio": data.dependency_ratio,
+            "risk_factors": ", ".join(metrics.urgency_factors),
+        })
+
+    async def analyze_many(self, pairs: List[Tuple[DemographicData, TrendMetrics]]) -> List[str]:
+        """
+        Analyze many regions concurrently (bounded by concurrency_limit).
+        
+        Results are returned in input order.
+        """
+        return await asyncio.gather(
+            *(self.analyze_insight_async(data, metrics) for data, metrics in pairs)
+        )
+
+    def analyze_insight_batch(self, items: List[Tuple[DemographicData, TrendMetrics]],
+                              batch_size: int = 10) -> List[str]:
+        """
+        Generate insights for many regions, packing batch_size regions per call.
+        """
+        return self._run_sync(self.analyze_insight_batch_async(items, batch_size))
+
+    async def analyze_insight_batch_async(self, items: List[Tuple[DemographicData, TrendMetrics]],
+                                          batch_size: int = 10) -> List[str]:
+        """
+        Async version of analyze_insight_batch.
+        
+        Cuts API calls from N to N/batch_size; results are returned in input order.
+        """
+        batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+        results = await asyncio.gather(*(self._analyze_batch(batch) for batch in batches))
+        return [text for batch_results in results for text in batch_results]
+
+    async def _analyze_batch(self, batch: List[Tuple[DemographicData, TrendMetrics]]) -> List[str]:
+        """One Gemini call for a batch; falls back to per-region calls if the JSON reply is unusable"""
+        if not self.model or len(batch) == 1:
+            return list(await asyncio.gather(*(self.analyze_insight_async(d, m) for d, m in batch)))
+        
+        regions = "\n".join(
+            f'<REGION id="{k}">\n{self._format_region_stats(data, metrics)}\n</REGION>'
+            for k, (data, metrics) in enumerate(batch)
+        )
+        prompt = _BATCH_PROMPT.format_map({"count": len(batch), "regions": regions})
         
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            async with self._limiter():
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config=genai.GenerationConfig(response_mime_type="application/json"),
+                )
         except Exception as e:
-            return f"Gemini API 호출 중 오류가 발생했습니다: {e}"
+            return [f"Gemini API 호출 중 오류가 발생했습니다: {e}"] * len(batch)
+        
+        try:
+            replies = {int(r["id"]): r for r in json.loads(response.text)}
+            return [
+                f"1. [인구학적 추이 요약]: {replies[k]['summary']}\n"
+                f"2. [복지 Rationale]: {replies[k]['rationale']}\n"
+                f"3. [긴급 제언]: {replies[k]['urgent']}"
+                for k in range(len(batch))
+            ]
+        except (ValueError, KeyError, TypeError):
+            return list(await asyncio.gather(*(self.analyze_insight_async(d, m) for d, m in batch)))
+
+    @staticmethod
+    def _format_region_stats(data: DemographicData, metrics: TrendMetrics) -> str:
+        """Compact statistics block for one region in a batch prompt"""
+        return (
+            f"지역: {data.region_name} / 기준 연도: {data.year}\n"
+            f"총인구 {data.total_population:,}명, 고령화율 {data.aging_ratio:.1f}%, "
+            f"후기고령 {data.old_old:,}명 ({data.old_old_ratio:.1f}%), "
+            f"고령화 속도 {metrics.aging_velocity:.1f}%/년, 부양비 {data.dependency_ratio:.1f}%\n"
+            f"주요 위험 요인: {', '.join(metrics.urgency_factors)}"
+        )
 
     def ask_natural_query(self, query: str, context_data: Dict[str, Any]) -> str:
         """
         Handle natural language queries about the statistical data.
         """
+        return self._run_sync(self.ask_natural_query_async(query, context_data))
+
+    async def ask_natural_query_async(self, query: str, context_data: Dict[str, Any]) -> str:
+        """
+        Async version of ask_natural_query.
+        
+        Paraphrased questions about the same context are answered from the
+        semantic cache when their embeddings are close enough.
+        """
         if not self.model:
             return "Gemini API 키가 설정되지 않았습니다."
             
-        prompt = f"""
-        사용자가 지역 통계 데이터에 대해 다음과 같은 질문을 했습니다: "{query}"
+        prompt = _QUERY_PROMPT.format_map({"query": query, "context_data": context_data})
         
-        제공된 데이터 컨텍스트:
-        {context_data}
+        cached = self._cache_get(self._cache_key(prompt))
+        if cached is not None:
+            return cached
         
-        데이터에 기반하여 정확하고 친절하게 답변해 주세요. 
-        만약 데이터에 없는 내용이라면 추측하지 말고 모른다고 답변하세요.
-        답변은 300자 이내로 간결하게 작성하세요.
-        """
+        context_key = self._cache_key(repr(sorted(context_data.items())))
+        try:
+            embedding = await self._embed(query)
+        except Exception:
+            embedding = None  # embedding is only an optimization; fall through to Gemini
+        if embedding is not None:
+            answer = self._semantic_lookup(context_key, embedding)
+            if answer is not None:
+                return answer
         
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            answer = await self._generate_cached(prompt)
         except Exception as e:
             return f"오류 발생: {e}"
+        if embedding is not None:
+            self._semantic_add(context_key, embedding, answer)
+        return answer
@@ -15,11 +15,18 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
 
 from sodapop.core.processor import DemographicData, WelfareCluster
 from sodapop.core.analyzer import TrendMetrics, UrgencyLevel, ComparativeAnalysis
 
 
+# Report date format (Korean style, e.g. 2025년 01월 31일)
+_REPORT_DATE_FMT = '%Y년 %m월 %d일'
+
+
 class RationaleType(Enum):
     """Types of welfare rationale documents"""
     EXECUTIVE_SUMMARY = "executive_summary"
@@ -60,6 +67,16 @@ class RationaleOutput:
     citations: List[str]
 
 
+@dataclass(slots=True)
+class _Derived:
+    """Per-region derived shares (% of total population, computed once per call)"""
+    old_old_pct: float = 0.0
+    young_old_pct: float = 0.0
+    productive_pct: float = 0.0
+    male_pct: float = 0.0
+    female_pct: float = 0.0
+
+
 class WelfareRationaleGenerator:
     """
     Evidence-Based Welfare Rationale Generator
@@ -95,6 +112,13 @@ class WelfareRationaleGenerator:
         "low": "현재 안정적인 상태로 예방적 관리가 권장됩니다",
     }
     
+    # Old-old velocity phrases, thresholds descending ("감소" when none is exceeded)
+    TREND_PHRASES = (
+        (10, "급격히 증가"),
+        (5, "빠르게 증가"),
+        (0, "꾸준히 증가"),
+    )
+    
     # Service recommendation triggers
     SERVICE_TRIGGERS = {
         ServiceRecommendation.HOME_CARE: {
@@ -120,6 +144,23 @@ class WelfareRationaleGenerator:
         },
     }
     
+    # Primary recommendation rules, in priority order (sign=-1 means "below threshold")
+    PRIMARY_RULES = (
+        ("old_old_ratio", 1, 50, ServiceRecommendation.DEMENTIA_CARE),
+        ("old_old_ratio", 1, 45, ServiceRecommendation.HOME_CARE),
+        ("dependency_ratio", 1, 55, ServiceRecommendation.CAREGIVER_SUPPORT),
+        ("aging_ratio", 1, 25, ServiceRecommendation.TRANSPORTATION),
+        ("youth_velocity", -1, -3, ServiceRecommendation.YOUTH_WELFARE),
+    )
+    PRIMARY_DEFAULT = ServiceRecommendation.HEALTH_MANAGEMENT
+    
+    # Metric column order used by the rules (only youth_velocity comes from TrendMetrics)
+    _RULE_FIELDS = ("old_old_ratio", "dependency_ratio", "aging_ratio", "youth_velocity")
+    _RULE_COLUMNS = np.array(list(map(_RULE_FIELDS.index, (r[0] for r in PRIMARY_RULES))))
+    _RULE_SIGNS = np.array([r[1] for r in PRIMARY_RULES], dtype=np.float64)
+    _RULE_THRESHOLDS = np.array([r[2] for r in PRIMARY_RULES], dtype=np.float64)
+    _RULE_RESULTS = tuple(r[3] for r in PRIMARY_RULES) + (PRIMARY_DEFAULT,)
+    
     # National reference values (2024)
     NATIONAL_REF = {
         "aging_ratio": 19.2,
@@ -148,11 +189,14 @@ class WelfareRationaleGenerator:
         
         A concise, high-level overview suitable for executive briefings.
         """
+        now = datetime.now()
+        derived = self._derive(demo)
+        
         # Build key findings
         findings = self._extract_key_findings(demo, metrics)
         
         # Get recommendations
-        recommendations = self._generate_recommendations(demo, metrics)
+        recommendations = self._generate_recommendations(demo, metrics, derived)
         
         # Build summary paragraph
         summary = self._build_summary_paragraph(demo, metrics, comparison)
@@ -165,14 +209,14 @@ class WelfareRationaleGenerator:
         return RationaleOutput(
             type=RationaleType.EXECUTIVE_SUMMARY,
             region_name=demo.region_name,
-            generated_at=datetime.now().isoformat(),
+            generated_at=now.isoformat(),
             title=f"{demo.region_name} 인구구조 분석 요약",
             summary=summary,
             key_findings=findings,
             statistics=self._format_statistics(demo, metrics),
             recommendations=recommendations,
             full_text=full_text,
-            citations=self._generate_citations(demo.year),
+            citations=list(self._generate_citations(demo.year)),
         )
     
     def generate_proposal_snippet(self,
@@ -195,36 +239,29 @@ class WelfareRationaleGenerator:
         start_year = metrics.start_year
         
         # Calculate key metrics
-        old_old_pct = (demo.old_old / demo.total_population * 100) if demo.total_population > 0 else 0
+        derived = self._derive(demo)
         elderly_pct = demo.aging_ratio
         
         # Determine comparison to national
-        nat_comparison = self._compare_to_national(demo, metrics)
-        
-        # Determine urgency description
-        urgency_desc = self.TEMPLATES[metrics.urgency_level.name.lower()]
+        nat_comparison = self._compare_to_national(demo, metrics, derived)
         
         # Build the snippet
-        if metrics.old_old_velocity > 10:
-            trend_phrase = "급격히 증가"
-        elif metrics.old_old_velocity > 5:
-            trend_phrase = "빠르게 증가"
-        elif metrics.old_old_velocity > 0:
-            trend_phrase = "꾸준히 증가"
-        else:
-            trend_phrase = "감소"
-        
-        snippet = f"{region}의 75세 이상 후기고령인구는 {start_year}년 대비 {abs(metrics.old_old_velocity):.1f}% {trend_phrase}하여 "
-        snippet += f"현재 전체 인구의 {old_old_pct:.1f}%를 차지하고 있습니다. "
-        snippet += f"{nat_comparison} "
+        parts = [
+            f"{region}의 75세 이상 후기고령인구는 {start_year}년 대비 ",
+            f"{abs(metrics.old_old_velocity):.1f}% {self._trend_phrase(metrics.old_old_velocity)}하여 ",
+            f"현재 전체 인구의 {derived.old_old_pct:.1f}%를 차지하고 있습니다. ",
+            f"{nat_comparison} ",
+        ]
         
         # Add recommendation based on target service or auto-detect
         if target_service:
-            snippet += f"이에 따라 {target_service.value}의 확충이 시급합니다."
+            parts.append(f"이에 따라 {target_service.value}의 확충이 시급합니다.")
         else:
             primary_rec = self._get_primary_recommendation(demo, metrics)
             if primary_rec:
-                snippet += f"이에 따라 {primary_rec.value}의 확충이 필요합니다."
+                parts.append(f"이에 따라 {primary_rec.value}의 확충이 필요합니다.")
+        
+        snippet = "".join(parts)
         
         return snippet
     
@@ -243,14 +280,11 @@ class WelfareRationaleGenerator:
         
         alert_level = "🚨" if metrics.urgency_level in [UrgencyLevel.CRITICAL, UrgencyLevel.HIGH] else "⚠️"
         
-        alert = f"{alert_level} {region} 인구구조 변동 감지\n\n"
-        
-        for anomaly in anomalies:
-            alert += f"• {anomaly}\n"
+        parts = [f"{alert_level} {region} 인구구조 변동 감지\n\n"]
+        parts.extend(f"• {anomaly}\n" for anomaly in anomalies)
+        parts.append(f"\n권장 조치: {self._urgency_phrase(metrics.urgency_level)}")
         
-        alert += f"\n권장 조치: {self.TEMPLATES[metrics.urgency_level.name.lower()]}"
-        
-        return alert
+        return "".join(parts)
     
     def generate_comparison_brief(self,
                                    region1_demo: DemographicData,
@@ -263,37 +297,37 @@ class WelfareRationaleGenerator:
         r1 = region1_demo.region_name
         r2 = region2_demo.region_name
         
-        brief = f"## {r1} vs {r2} 비교 분석\n\n"
+        parts = [f"## {r1} vs {r2} 비교 분석\n\n"]
         
         # Population comparison
         pop_diff = region1_demo.total_population - region2_demo.total_population
-        brief += f"**인구 규모**: {r1}({region1_demo.total_population:,}명) "
-        brief += f"{'>' if pop_diff > 0 else '<'} {r2}({region2_demo.total_population:,}명)\n\n"
+        parts.append(f"**인구 규모**: {r1}({region1_demo.total_population:,}명) ")
+        parts.append(f"{'>' if pop_diff > 0 else '<'} {r2}({region2_demo.total_population:,}명)\n\n")
         
         # Aging comparison
-        brief += f"**고령화율**: {r1}({region1_demo.aging_ratio:.1f}%) vs {r2}({region2_demo.aging_ratio:.1f}%)\n"
+        parts.append(f"**고령화율**: {r1}({region1_demo.aging_ratio:.1f}%) vs {r2}({region2_demo.aging_ratio:.1f}%)\n")
         if region1_demo.aging_ratio > region2_demo.aging_ratio:
             diff = region1_demo.aging_ratio - region2_demo.aging_ratio
-            brief += f"→ {r1}이(가) {diff:.1f}%p 더 고령화됨\n\n"
+            parts.append(f"→ {r1}이(가) {diff:.1f}%p 더 고령화됨\n\n")
         else:
             diff = region2_demo.aging_ratio - region1_demo.aging_ratio
-            brief += f"→ {r2}이(가) {diff:.1f}%p 더 고령화됨\n\n"
+            parts.append(f"→ {r2}이(가) {diff:.1f}%p 더 고령화됨\n\n")
         
         # Velocity comparison
-        brief += f"**고령화 속도**: {r1}({region1_metrics.aging_velocity:.1f}%/년) vs {r2}({region2_metrics.aging_velocity:.1f}%/년)\n"
+        parts.append(f"**고령화 속도**: {r1}({region1_metrics.aging_velocity:.1f}%/년) vs {r2}({region2_metrics.aging_velocity:.1f}%/년)\n")
         if region1_metrics.aging_velocity > region2_metrics.aging_velocity:
-            brief += f"→ {r1}의 고령화가 더 빠르게 진행 중\n\n"
+            parts.append(f"→ {r1}의 고령화가 더 빠르게 진행 중\n\n")
         else:
-            brief += f"→ {r2}의 고령화가 더 빠르게 진행 중\n\n"
+            parts.append(f"→ {r2}의 고령화가 더 빠르게 진행 중\n\n")
         
         # Policy implication
-        brief += "### 정책적 시사점\n\n"
+        parts.append("### 정책적 시사점\n\n")
         if region1_metrics.urgency_score > region2_metrics.urgency_score:
-            brief += f"{r1}에 대한 우선적 복지자원 배분이 필요합니다."
+            parts.append(f"{r1}에 대한 우선적 복지자원 배분이 필요합니다.")
         else:
-            brief += f"{r2}에 대한 우선적 복지자원 배분이 필요합니다."
+            parts.append(f"{r2}에 대한 우선적 복지자원 배분이 필요합니다.")
         
-        return brief
+        return "".join(parts)
     
     def generate_full_report(self,
                               demo: DemographicData,
@@ -306,11 +340,13 @@ class WelfareRationaleGenerator:
         """
         region = demo.region_name
         year = demo.year
+        now = datetime.now()
+        derived = self._derive(demo)
         
-        report = f"""# {region} 인구구조 분석 보고서
+        parts = [f"""# {region} 인구구조 분석 보고서
 
 **분석 기준일**: {year}년
-**생성일시**: {datetime.now().strftime('%Y년 %m월 %d일')}
+**생성일시**: {now.strftime(_REPORT_DATE_FMT)}
 
 ---
 
@@ -337,14 +373,14 @@ class WelfareRationaleGenerator:
 | 구분 | 연령대 | 인구수 | 비율 | 복지 초점 |
 |------|--------|--------|------|----------|
 | 아동·청소년 | 0-18세 | {demo.children_youth:,}명 | {demo.youth_ratio:.1f}% | 발달 및 보호 |
-| 생산가능인구 | 19-64세 | {demo.productive:,}명 | {(demo.productive/demo.total_population*100) if demo.total_population else 0:.1f}% | 고용 및 가족지원 |
-| 전기고령 | 65-74세 | {demo.young_old:,}명 | {(demo.young_old/demo.total_population*100) if demo.total_population else 0:.1f}% | 사회참여 활성화 |
-| 후기고령 | 75세 이상 | {demo.old_old:,}명 | {(demo.old_old/demo.total_population*100) if demo.total_population else 0:.1f}% | 집중돌봄 |
+| 생산가능인구 | 19-64세 | {demo.productive:,}명 | {derived.productive_pct:.1f}% | 고용 및 가족지원 |
+| 전기고령 | 65-74세 | {demo.young_old:,}명 | {derived.young_old_pct:.1f}% | 사회참여 활성화 |
+| 후기고령 | 75세 이상 | {demo.old_old:,}명 | {derived.old_old_pct:.1f}% | 집중돌봄 |
 
 ### 2.2 성별 분포
 
-- **남성**: {demo.male_population:,}명 ({(demo.male_population/demo.total_population*100) if demo.total_population else 0:.1f}%)
-- **여성**: {demo.female_population:,}명 ({(demo.female_population/demo.total_population*100) if demo.total_population else 0:.1f}%)
+- **남성**: {demo.male_population:,}명 ({derived.male_pct:.1f}%)
+- **여성**: {demo.female_population:,}명 ({derived.female_pct:.1f}%)
 - **성비**: {demo.gender_ratio:.1f} (여성 100명당 남성 수)
 
 ---
@@ -359,55 +395,79 @@ class WelfareRationaleGenerator:
 
 | 연도 | 총인구 | 고령인구 | 고령화율 |
 |------|--------|----------|----------|
-"""
+"""]
         # Add yearly data
-        for year in sorted(historical_data.keys()):
-            d = historical_data[year]
-            report += f"| {year} | {d.total_population:,} | {d.elderly_total:,} | {d.aging_ratio:.1f}% |\n"
+        parts.extend(
+            f"| {y} | {d.total_population:,} | {d.elderly_total:,} | {d.aging_ratio:.1f}% |\n"
+            for y, d in sorted(historical_data.items())
+        )
         
-        report += f"""
+        parts.append(f"""
 ---
 
 ## 4. 복지 긴급도 평가
 
 ### 긴급도 점수: **{metrics.urgency_score:.0f}/100** ({metrics.urgency_level.name})
 
-{self.TEMPLATES[metrics.urgency_level.name.lower()]}
+{self._urgency_phrase(metrics.urgency_level)}
 
 ### 주요 위험 요인
 
-"""
-        for factor in metrics.urgency_factors:
-            report += f"- {factor}\n"
+""")
+        parts.extend(f"- {factor}\n" for factor in metrics.urgency_factors)
         
-        report += f"""
+        parts.append("""
 ---
 
 ## 5. 정책 권고사항
 
-"""
-        recommendations = self._generate_recommendations(demo, metrics)
-        for i, rec in enumerate(recommendations, 1):
-            report += f"{i}. {rec}\n"
+""")
+        recommendations = self._generate_recommendations(demo, metrics, derived)
+        parts.extend(f"{i}. {rec}\n" for i, rec in enumerate(recommendations, 1))
         
-        report += f"""
+        parts.append("""
 ---
 
 ## 6. 데이터 출처
 
-"""
-        citations = self._generate_citations(demo.year)
-        for citation in citations:
-            report += f"- {citation}\n"
+""")
+        parts.extend(f"- {citation}\n" for citation in self._generate_citations(demo.year))
         
-        report += f"""
+        parts.append("""
 ---
 
 *본 보고서는 SODAPOP 2.0 시스템에 의해 자동 생성되었습니다.*
 *분석 결과의 해석과 정책 결정은 전문가의 검토가 필요합니다.*
-"""
+""")
         
-        return report
+        return "".join(parts)
+    
+    @classmethod
+    def _urgency_phrase(cls, level: UrgencyLevel) -> str:
+        """Policy recommendation phrase for an urgency level"""
+        return cls.TEMPLATES[level.key]
+    
+    @classmethod
+    def _trend_phrase(cls, velocity: float) -> str:
+        """Trend phrase for an old-old velocity"""
+        for threshold, phrase in cls.TREND_PHRASES:
+            if velocity > threshold:
+                return phrase
+        return "감소"
+    
+    @staticmethod
+    def _derive(demo: DemographicData) -> _Derived:
+        """Compute the derived shares of total population (all 0 when total is 0)"""
+        total = demo.total_population
+        if not total:
+            return _Derived()
+        return _Derived(
+            old_old_pct=demo.old_old / total * 100,
+            young_old_pct=demo.young_old / total * 100,
+            productive_pct=demo.productive / total * 100,
+            male_pct=demo.male_population / total * 100,
+            female_pct=demo.female_population / total * 100,
+        )
     
     def _extract_key_findings(self, demo: DemographicData, 
                                metrics: TrendMetrics) -> List[str]:
@@ -440,7 +500,8 @@ class WelfareRationaleGenerator:
         return findings if findings else ["특이사항 없음"]
     
     def _generate_recommendations(self, demo: DemographicData,
-                                    metrics: TrendMetrics) -> List[str]:
+                                    metrics: TrendMetrics,
+                                    derived: _Derived) -> List[str]:
         """Generate service recommendations based on analysis"""
         recommendations = []
         
@@ -456,8 +517,7 @@ class WelfareRationaleGenerator:
             )
         
         # Young-old focused services
-        young_old_ratio = (demo.young_old / demo.total_population * 100) if demo.total_population else 0
-        if young_old_ratio > 8:
+        if derived.young_old_pct > 8:
             recommendations.append(
                 f"전기고령인구({demo.young_old:,}명) 사회참여 활성화 프로그램 개발"
             )
@@ -502,9 +562,6 @@ class WelfareRationaleGenerator:
         else:
             status = "고령화가 진행 중인"
         
-        summary = f"{region}은(는) {status} 지역으로, "
-        summary += f"현재 65세 이상 고령인구가 전체 인구의 {demo.aging_ratio:.1f}%를 차지하고 있습니다. "
-        
         # Trend description
         if metrics.aging_velocity > 5:
             trend_desc = "급속한 고령화가 진행되고 있으며"
@@ -513,21 +570,25 @@ class WelfareRationaleGenerator:
         else:
             trend_desc = "비교적 완만한 고령화 추이를 보이고 있으며"
         
-        summary += f"최근 {metrics.end_year - metrics.start_year}년간 {trend_desc}, "
-        summary += f"특히 75세 이상 후기고령인구는 연평균 {metrics.old_old_velocity:.1f}%씩 증가하고 있습니다. "
-        
-        # Policy implication
-        summary += self.TEMPLATES[metrics.urgency_level.name.lower()] + "."
+        summary = "".join([
+            f"{region}은(는) {status} 지역으로, ",
+            f"현재 65세 이상 고령인구가 전체 인구의 {demo.aging_ratio:.1f}%를 차지하고 있습니다. ",
+            f"최근 {metrics.end_year - metrics.start_year}년간 {trend_desc}, ",
+            f"특히 75세 이상 후기고령인구는 연평균 {metrics.old_old_velocity:.1f}%씩 증가하고 있습니다. ",
+            # Policy implication
+            self._urgency_phrase(metrics.urgency_level),
+            ".",
+        ])
         
         return summary
     
     def _compare_to_national(self, demo: DemographicData, 
-                              metrics: TrendMetrics) -> str:
+                              metrics: TrendMetrics,
+                              derived: _Derived) -> str:
         """Generate national comparison phrase"""
         national_old_old = 6.8  # Approximate national 75+ ratio
         
-        old_old_pct = (demo.old_old / demo.total_population * 100) if demo.total_population else 0
-        diff = old_old_pct - national_old_old
+        diff = derived.old_old_pct - national_old_old
         
         if diff > 2:
             return f"이는 전국 평균({national_old_old:.1f}%)을 {diff:.1f}%p 상회하는 수치입니다."
@@ -539,18 +600,33 @@ class WelfareRationaleGenerator:
     def _get_primary_recommendation(self, demo: DemographicData,
                                      metrics: TrendMetrics) -> Optional[ServiceRecommendation]:
         """Determine the most appropriate service recommendation"""
-        if demo.old_old_ratio > 50:
-            return ServiceRecommendation.DEMENTIA_CARE
-        elif demo.old_old_ratio > 45:
-            return ServiceRecommendation.HOME_CARE
-        elif demo.dependency_ratio > 55:
-            return ServiceRecommendation.CAREGIVER_SUPPORT
-        elif demo.aging_ratio > 25:
-            return ServiceRecommendation.TRANSPORTATION
-        elif metrics.youth_velocity < -3:
-            return ServiceRecommendation.YOUTH_WELFARE
-        else:
-            return ServiceRecommendation.HEALTH_MANAGEMENT
+        return self.recommend_batch([demo], [metrics])[0]
+    
+    def recommend_batch(self,
+                        demos: List[DemographicData],
+                        metrics_list: List[TrendMetrics]) -> List[ServiceRecommendation]:
+        """
+        Determine the primary recommended service for many regions at once
+        
+        Evaluates PRIMARY_RULES as an (N, rules) comparison matrix and picks
+        each region's first matching rule (PRIMARY_DEFAULT if none match).
+        """
+        if not demos:
+            return []
+        
+        values = np.array(
+            [(d.old_old_ratio, d.dependency_ratio, d.aging_ratio, m.youth_velocity)
+             for d, m in zip(demos, metrics_list)],
+            dtype=np.float64,
+        )
+        
+        # Multiplying by sign turns "below" rules into "above" comparisons
+        signs = self._RULE_SIGNS
+        matched = values[:, self._RULE_COLUMNS] * signs > self._RULE_THRESHOLDS * signs
+        matched = np.column_stack([matched, np.ones(len(values), dtype=bool)])
+        
+        results = self._RULE_RESULTS
+        return [results[i] for i in np.argmax(matched, axis=1)]
     
     def _format_statistics(self, demo: DemographicData,
                             metrics: TrendMetrics) -> Dict[str, str]:
@@ -572,27 +648,28 @@ class WelfareRationaleGenerator:
                                    recommendations: List[str],
                                    summary: str) -> str:
         """Format complete executive summary"""
-        text = f"# {demo.region_name} 인구구조 분석 요약\n\n"
-        text += f"## 개요\n\n{summary}\n\n"
-        
-        text += "## 핵심 발견사항\n\n"
-        for finding in findings:
-            text += f"• {finding}\n"
+        parts = [
+            f"# {demo.region_name} 인구구조 분석 요약\n\n",
+            f"## 개요\n\n{summary}\n\n",
+            "## 핵심 발견사항\n\n",
+        ]
+        parts.extend(f"• {finding}\n" for finding in findings)
         
-        text += "\n## 권고사항\n\n"
-        for i, rec in enumerate(recommendations, 1):
-            text += f"{i}. {rec}\n"
+        parts.append("\n## 권고사항\n\n")
+        parts.extend(f"{i}. {rec}\n" for i, rec in enumerate(recommendations, 1))
         
-        return text
+        return "".join(parts)
     
-    def _generate_citations(self, year: int) -> List[str]:
-        """Generate data source citations"""
-        return [
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _generate_citations(year: int) -> Tuple[str, ...]:
+        """Generate data source citations (one shared tuple per year)"""
+        return (
             f"통계청, 「주민등록인구현황」, {year}년",
             f"통계청, 「장래인구추계」, {year}년",
             "행정안전부, 「행정구역코드」",
             f"국가통계포털(KOSIS), 인구총조사, {year}년",
-        ]
+        )
     
     def _generate_trend_narrative(self, metrics: TrendMetrics) -> str:
         """Generate narrative description of trends"""
@@ -12,8 +12,12 @@ Features:
 - Export-ready for reports
 """
 
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
@@ -21,6 +25,14 @@ import numpy as np
 from sodapop.core.processor import DemographicData, WelfareCluster
 
 
+# Animation options shared by every temporal-pyramid slider step
+_STEP_ANIM_ARGS = {
+    "frame": {"duration": 500, "redraw": True},
+    "mode": "immediate",
+    "transition": {"duration": 500},
+}
+
+
 class PopulationPyramid:
     """
     Interactive Population Pyramid Generator
@@ -45,6 +57,34 @@ class PopulationPyramid:
         "60-64", "65-69", "70-74", "75-79",
         "80-84", "85+"
     ]
+    _AGE_GROUPS_ARR = np.asarray(STANDARD_AGE_GROUPS)  # trace y values (array fast path)
+    
+    # Layout pieces shared by the pyramid charts
+    _LEGEND_H = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5)
+    _YAXIS_AGE = dict(title="연령대", categoryorder='array', categoryarray=STANDARD_AGE_GROUPS)
+    
+    # Age distribution weights (typical Korean pattern), aligned with STANDARD_AGE_GROUPS
+    _WEIGHTS = np.array([
+        0.025, 0.03, 0.035, 0.04,
+        0.055, 0.065, 0.07, 0.075,
+        0.08, 0.085, 0.085, 0.08,
+        0.075, 0.065, 0.055, 0.04,
+        0.025, 0.015,
+    ], dtype=np.float64)
+    
+    # Male share per age group (more females in the oldest groups)
+    _MALE_PCT = np.array([0.51] * 13 + [0.45] * 2 + [0.38] * 3, dtype=np.float64)
+    
+    # STANDARD_AGE_GROUPS index range of each welfare cluster
+    _CLUSTER_SLICES = {
+        WelfareCluster.CHILDREN_YOUTH: slice(0, 4),     # 0-19
+        WelfareCluster.PRODUCTIVE: slice(4, 13),        # 20-64
+        WelfareCluster.YOUNG_OLD: slice(13, 15),        # 65-74
+        WelfareCluster.OLD_OLD: slice(15, 18),          # 75+
+    }
+    
+    # Max (male, female) estimates kept in the per-instance distribution cache
+    DIST_CACHE_SIZE = 1024
     
     # Color scheme
     MALE_COLOR = "#3498db"
@@ -60,23 +100,7 @@ class PopulationPyramid:
             theme: Plotly template theme
         """
         self.theme = theme
-    
-    def _get_cluster_for_age(self, age_group: str) -> WelfareCluster:
-        """Determine welfare cluster for an age group"""
-        # Parse the age group to get the starting age
-        if age_group.endswith("+"):
-            start_age = int(age_group.replace("+", "").split("-")[0])
-        else:
-            start_age = int(age_group.split("-")[0])
-        
-        if start_age <= 18:
-            return WelfareCluster.CHILDREN_YOUTH
-        elif start_age <= 64:
-            return WelfareCluster.PRODUCTIVE
-        elif start_age <= 74:
-            return WelfareCluster.YOUNG_OLD
-        else:
-            return WelfareCluster.OLD_OLD
+        self._dist_cache: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = {}
     
     def create_basic_pyramid(self, 
                              demo: DemographicData,
@@ -98,30 +122,28 @@ class PopulationPyramid:
         # Generate sample age distribution if not available
         age_data = self._generate_age_distribution(demo)
         
-        fig = go.Figure()
+        traces = []
+        
+        male = np.asarray(age_data['male'], dtype=np.int32)
+        female = np.asarray(age_data['female'], dtype=np.int32)
         
         # Male bars (negative values for left side)
-        male_values = [-v for v in age_data['male']]
-        female_values = age_data['female']
+        neg_male = -male
         
         if show_clusters:
-            # Add bars by cluster with different colors
-            for cluster in WelfareCluster:
-                cluster_mask = [self._get_cluster_for_age(ag) == cluster 
-                               for ag in self.STANDARD_AGE_GROUPS]
-                
-                male_cluster = [male_values[i] if cluster_mask[i] else 0 
-                               for i in range(len(male_values))]
-                female_cluster = [female_values[i] if cluster_mask[i] else 0 
-                                 for i in range(len(female_values))]
+            # One trace pair per welfare cluster over its own age-group slice;
+            # the pair shares a legend group so a legend click hides both sides
+            for cluster, sl in self._CLUSTER_SLICES.items():
+                color = self.CLUSTER_COLORS[cluster]
+                ages = self._AGE_GROUPS_ARR[sl]
                 
                 # Male (left side)
-                fig.add_trace(go.Bar(
-                    name=f'{cluster.korean_name} (남)',
-                    y=self.STANDARD_AGE_GROUPS,
-                    x=male_cluster,
+                traces.append(go.Bar(
+                    name=cluster.korean_name,
+                    y=ages,
+                    x=neg_male[sl],
                     orientation='h',
-                    marker_color=self.CLUSTER_COLORS[cluster],
+                    marker_color=color,
                     marker_line_width=0,
                     opacity=0.8,
                     legendgroup=cluster.value,
@@ -131,16 +153,16 @@ class PopulationPyramid:
                         "연령: %{y}<br>" +
                         "남성: %{customdata:,}명<extra></extra>"
                     ),
-                    customdata=[-v for v in male_cluster],
+                    customdata=male[sl],
                 ))
                 
                 # Female (right side) - lighter shade
-                fig.add_trace(go.Bar(
-                    name=f'{cluster.korean_name} (여)',
-                    y=self.STANDARD_AGE_GROUPS,
-                    x=female_cluster,
+                traces.append(go.Bar(
+                    name=cluster.korean_name,
+                    y=ages,
+                    x=female[sl],
                     orientation='h',
-                    marker_color=self.CLUSTER_COLORS[cluster],
+                    marker_color=color,
                     marker_line_width=0,
                     opacity=0.5,
                     legendgroup=cluster.value,
@@ -153,29 +175,30 @@ class PopulationPyramid:
                 ))
         else:
             # Simple two-color pyramid
-            fig.add_trace(go.Bar(
+            traces.append(go.Bar(
                 name='남성',
-                y=self.STANDARD_AGE_GROUPS,
-                x=male_values,
+                y=self._AGE_GROUPS_ARR,
+                x=neg_male,
                 orientation='h',
                 marker_color=self.MALE_COLOR,
                 hovertemplate="연령: %{y}<br>남성: %{customdata:,}명<extra></extra>",
-                customdata=[-v for v in male_values],
+                customdata=male,
             ))
             
-            fig.add_trace(go.Bar(
+            traces.append(go.Bar(
                 name='여성',
-                y=self.STANDARD_AGE_GROUPS,
-                x=female_values,
+                y=self._AGE_GROUPS_ARR,
+                x=female,
                 orientation='h',
                 marker_color=self.FEMALE_COLOR,
                 hovertemplate="연령: %{y}<br>여성: %{x:,}명<extra></extra>",
             ))
         
         # Calculate max for symmetric axis
-        max_val = max(max(abs(v) for v in male_values), max(female_values)) * 1.1
+        max_val = float(max(male.max(), female.max())) * 1.1
+        ticks = self._generate_ticks(max_val)
         
-        fig.update_layout(
+        layout = dict(
             title=dict(
                 text=title,
                 font=dict(size=18, family="Pretendard, sans-serif"),
@@ -188,21 +211,11 @@ class PopulationPyramid:
                 title="인구 수",
                 range=[-max_val, max_val],
                 tickformat=",d",
-                tickvals=self._generate_ticks(max_val),
-                ticktext=[f"{abs(int(v)):,}" for v in self._generate_ticks(max_val)],
-            ),
-            yaxis=dict(
-                title="연령대",
-                categoryorder='array',
-                categoryarray=self.STANDARD_AGE_GROUPS,
-            ),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="center",
-                x=0.5,
+                tickvals=ticks,
+                ticktext=[f"{abs(int(v)):,}" for v in ticks],
             ),
+            yaxis=self._YAXIS_AGE,
+            legend=self._LEGEND_H,
             annotations=[
                 dict(
                     text="← 남성",
@@ -227,7 +240,54 @@ class PopulationPyramid:
             margin=dict(l=80, r=80, t=100, b=60),
         )
         
-        return fig
+        return go.Figure(data=traces, layout=layout)
+    
+    def create_many(self,
+                    demos: List[DemographicData],
+                    show_clusters: bool = True,
+                    max_workers: Optional[int] = None) -> List[go.Figure]:
+        """
+        Create basic pyramids for many regions/years across processes
+        
+        Worker output is parsed back into Figures here, which costs about as
+        much as rendering the figures serially and cancels most of the
+        parallel gain; use create_many_json when JSON is enough.
+        
+        Args:
+            demos: DemographicData objects, one figure each (input order kept)
+            show_clusters: Highlight welfare clusters with colors
+            max_workers: Worker processes (default: CPU count)
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if len(demos) <= 1 or workers == 1:
+            return [self.create_basic_pyramid(demo, show_clusters=show_clusters) for demo in demos]
+        return [pio.from_json(result)
+                for result in self._render_parallel(demos, show_clusters, workers)]
+    
+    def create_many_json(self,
+                         demos: List[DemographicData],
+                         show_clusters: bool = True,
+                         max_workers: Optional[int] = None) -> List[str]:
+        """
+        create_many returning figure JSON strings (for export/HTML embedding)
+        
+        Skips re-validating each Figure in this process, so the parallel
+        rendering is not cancelled out.
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if len(demos) <= 1 or workers == 1:
+            return [self.create_basic_pyramid(demo, show_clusters=show_clusters).to_json()
+                    for demo in demos]
+        return self._render_parallel(demos, show_clusters, workers)
+    
+    def _render_parallel(self, demos: List[DemographicData],
+                         show_clusters: bool, workers: int) -> List[str]:
+        """Render basic pyramids in a process pool (figure JSON, input order kept)"""
+        jobs = [(self.theme, demo, show_clusters) for demo in demos]
+        # Few large chunks per worker keep pickling/IPC overhead low
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_render_basic_pyramid, jobs, chunksize=chunksize))
     
     def create_comparison_pyramid(self,
                                    demo1: DemographicData,
@@ -246,20 +306,20 @@ class PopulationPyramid:
         age_data1 = self._generate_age_distribution(demo1)
         age_data2 = self._generate_age_distribution(demo2)
         
-        fig = go.Figure()
+        traces = []
         
         # Primary data (solid)
-        fig.add_trace(go.Bar(
+        traces.append(go.Bar(
             name=f'{labels[0]} (남)',
-            y=self.STANDARD_AGE_GROUPS,
-            x=[-v for v in age_data1['male']],
+            y=self._AGE_GROUPS_ARR,
+            x=-np.asarray(age_data1['male'], dtype=np.int32),
             orientation='h',
             marker_color=self.MALE_COLOR,
             opacity=0.8,
         ))
-        fig.add_trace(go.Bar(
+        traces.append(go.Bar(
             name=f'{labels[0]} (여)',
-            y=self.STANDARD_AGE_GROUPS,
+            y=self._AGE_GROUPS_ARR,
             x=age_data1['female'],
             orientation='h',
             marker_color=self.FEMALE_COLOR,
@@ -267,29 +327,29 @@ class PopulationPyramid:
         ))
         
         # Comparison data (outline only)
-        fig.add_trace(go.Scatter(
+        traces.append(go.Scatter(
             name=f'{labels[1]} (남)',
-            y=self.STANDARD_AGE_GROUPS,
-            x=[-v for v in age_data2['male']],
+            y=self._AGE_GROUPS_ARR,
+            x=-np.asarray(age_data2['male'], dtype=np.int32),
             mode='lines',
             line=dict(color=self.MALE_COLOR, width=2, dash='dash'),
         ))
-        fig.add_trace(go.Scatter(
+        traces.append(go.Scatter(
             name=f'{labels[1]} (여)',
-            y=self.STANDARD_AGE_GROUPS,
+            y=self._AGE_GROUPS_ARR,
             x=age_data2['female'],
             mode='lines',
             line=dict(color=self.FEMALE_COLOR, width=2, dash='dash'),
         ))
         
-        max_val = max(
-            max(abs(v) for v in age_data1['male']),
-            max(age_data1['female']),
-            max(abs(v) for v in age_data2['male']),
-            max(age_data2['female'])
-        ) * 1.1
+        max_val = float(max(
+            np.abs(age_data1['male']).max(),
+            age_data1['female'].max(),
+            np.abs(age_data2['male']).max(),
+            age_data2['female'].max(),
+        )) * 1.1
         
-        fig.update_layout(
+        layout = dict(
             title=dict(
                 text=f"인구구조 비교: {labels[0]} vs {labels[1]}",
                 font=dict(size=18),
@@ -302,18 +362,12 @@ class PopulationPyramid:
                 range=[-max_val, max_val],
                 tickformat=",d",
             ),
-            yaxis=dict(title="연령대"),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="center",
-                x=0.5,
-            ),
+            yaxis=self._YAXIS_AGE,
+            legend=self._LEGEND_H,
             height=600,
         )
         
-        return fig
+        return go.Figure(data=traces, layout=layout)
     
     def create_temporal_pyramid(self,
                                  region_data: Dict[int, DemographicData],
@@ -329,75 +383,73 @@ class PopulationPyramid:
         
         region_name = region_data[years[0]].region_name
         
-        # Prepare data for all years
+        # Prepare data for all years (only the first one is shown without animation)
         frames_data = {}
         max_val = 0
         
-        for year in years:
+        for year in (years if animate else years[:1]):
             demo = region_data[year]
             age_data = self._generate_age_distribution(demo)
-            frames_data[year] = age_data
-            max_val = max(
-                max_val,
-                max(abs(v) for v in age_data['male']),
-                max(age_data['female'])
-            )
+            # (negated male, female) once per year, shared by the base traces and frames
+            frames_data[year] = (-np.asarray(age_data['male'], dtype=np.int32), age_data['female'])
+            max_val = max(max_val, np.abs(age_data['male']).max(), age_data['female'].max())
         
-        max_val *= 1.1
+        max_val = float(max_val) * 1.1
         
         # Create figure with first year
-        first_data = frames_data[years[0]]
-        
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    name='남성',
-                    y=self.STANDARD_AGE_GROUPS,
-                    x=[-v for v in first_data['male']],
-                    orientation='h',
-                    marker_color=self.MALE_COLOR,
-                ),
-                go.Bar(
-                    name='여성',
-                    y=self.STANDARD_AGE_GROUPS,
-                    x=first_data['female'],
-                    orientation='h',
-                    marker_color=self.FEMALE_COLOR,
-                ),
-            ]
+        first_male, first_female = frames_data[years[0]]
+        
+        traces = [
+            go.Bar(
+                name='남성',
+                y=self._AGE_GROUPS_ARR,
+                x=first_male,
+                orientation='h',
+                marker_color=self.MALE_COLOR,
+            ),
+            go.Bar(
+                name='여성',
+                y=self._AGE_GROUPS_ARR,
+                x=first_female,
+                orientation='h',
+                marker_color=self.FEMALE_COLOR,
+            ),
+        ]
+        
+        layout = dict(
+            title=dict(
+                text=f"{region_name} 인구 피라미드 ({years[0]}년)",
+                font=dict(size=18),
+                x=0.5,
+            ),
+            barmode='overlay',
+            template=self.theme,
+            xaxis=dict(
+                title="인구 수",
+                range=[-max_val, max_val],
+                tickformat=",d",
+            ),
+            yaxis=self._YAXIS_AGE,
+            height=650,
+            margin=dict(b=100),
         )
         
+        frames = None
         if animate:
-            # Create frames for animation
+            # Create frames for animation: plain dict specs that only patch the
+            # x values of traces 0/1 (validated once by go.Figure)
             frames = []
             for year in years:
-                year_data = frames_data[year]
-                frame = go.Frame(
-                    data=[
-                        go.Bar(
-                            y=self.STANDARD_AGE_GROUPS,
-                            x=[-v for v in year_data['male']],
-                            orientation='h',
-                            marker_color=self.MALE_COLOR,
-                        ),
-                        go.Bar(
-                            y=self.STANDARD_AGE_GROUPS,
-                            x=year_data['female'],
-                            orientation='h',
-                            marker_color=self.FEMALE_COLOR,
-                        ),
-                    ],
-                    name=str(year),
-                    layout=go.Layout(
-                        title_text=f"{region_name} 인구 피라미드 ({year}년)"
-                    )
-                )
-                frames.append(frame)
-            
-            fig.frames = frames
+                neg_male, female = frames_data[year]
+                frames.append({
+                    'data': [{'type': 'bar', 'x': neg_male}, {'type': 'bar', 'x': female}],
+                    'traces': [0, 1],
+                    'name': str(year),
+                    'layout': {'title': {'text': f"{region_name} 인구 피라미드 ({year}년)"}},
+                })
             
             # Add animation controls
-            fig.update_layout(
+            layout.update(
                 updatemenus=[
                     dict(
                         type="buttons",
@@ -443,37 +495,15 @@ class PopulationPyramid:
                     "x": 0.1,
                     "y": 0,
                     "steps": [
-                        {"args": [[str(year)], {
-                            "frame": {"duration": 500, "redraw": True},
-                            "mode": "immediate",
-                            "transition": {"duration": 500}
-                        }],
-                        "label": str(year),
-                        "method": "animate"}
+                        {"args": [[str(year)], _STEP_ANIM_ARGS],
+                         "label": str(year),
+                         "method": "animate"}
                         for year in years
                     ]
                 }]
             )
         
-        fig.update_layout(
-            title=dict(
-                text=f"{region_name} 인구 피라미드 ({years[0]}년)",
-                font=dict(size=18),
-                x=0.5,
-            ),
-            barmode='overlay',
-            template=self.theme,
-            xaxis=dict(
-                title="인구 수",
-                range=[-max_val, max_val],
-                tickformat=",d",
-            ),
-            yaxis=dict(title="연령대"),
-            height=650,
-            margin=dict(b=100),
-        )
-        
-        return fig
+        return go.Figure(data=traces, layout=layout, frames=frames)
     
     def create_cluster_breakdown(self, demo: DemographicData) -> go.Figure:
         """
@@ -488,21 +518,29 @@ class PopulationPyramid:
             (WelfareCluster.OLD_OLD, demo.old_old),
         ]
         
-        fig = go.Figure(data=[go.Pie(
+        # Slice labels precomputed here instead of formatted client-side
+        total = sum(value for _, value in clusters)
+        text = [
+            f"{cluster.korean_name}<br>{(value / total if total else 0):.1%}"
+            for cluster, value in clusters
+        ]
+        
+        traces = [go.Pie(
             labels=[c[0].korean_name for c in clusters],
             values=[c[1] for c in clusters],
             hole=0.4,
             marker_colors=[self.CLUSTER_COLORS[c[0]] for c in clusters],
-            textinfo='label+percent',
+            text=text,
+            textinfo='text',
             textposition='outside',
             hovertemplate=(
                 "<b>%{label}</b><br>" +
                 "인구: %{value:,}명<br>" +
                 "비율: %{percent}<extra></extra>"
             ),
-        )])
+        )]
         
-        fig.update_layout(
+        layout = dict(
             title=dict(
                 text=f"{demo.region_name} 복지대상 인구구성 ({demo.year}년)",
                 font=dict(size=18),
@@ -528,14 +566,31 @@ class PopulationPyramid:
             ),
         )
         
-        return fig
+        return go.Figure(data=traces, layout=layout)
     
-    def _generate_age_distribution(self, demo: DemographicData) -> Dict[str, List[int]]:
+    def _generate_age_distribution(self, demo: DemographicData) -> Dict[str, np.ndarray]:
         """
         Generate age distribution data from DemographicData
         
         If detailed distribution not available, estimates from cluster totals.
+        Results are cached per input counts and returned as read-only arrays.
         """
+        key = (demo.region_code, demo.year, demo.total_population, demo.male_population,
+               demo.children_youth, demo.productive, demo.young_old, demo.old_old)
+        cached = self._dist_cache.get(key)
+        if cached is None:
+            cached = self._estimate_age_distribution(demo)
+            for arr in cached:
+                arr.setflags(write=False)
+            if len(self._dist_cache) >= self.DIST_CACHE_SIZE:
+                self._dist_cache.pop(next(iter(self._dist_cache)))
+            self._dist_cache[key] = cached
+        
+        male, female = cached
+        return {'male': male, 'female': female}
+    
+    def _estimate_age_distribution(self, demo: DemographicData) -> Tuple[np.ndarray, np.ndarray]:
+        """(male, female) counts per STANDARD_AGE_GROUPS entry"""
         # If we have actual age distribution, use it
         if demo.age_distribution:
             # Map to standard groups (implementation would parse actual data)
@@ -545,92 +600,67 @@ class PopulationPyramid:
         # This creates a realistic distribution shape
         total = demo.total_population
         if total == 0:
-            return {'male': [0] * len(self.STANDARD_AGE_GROUPS),
-                    'female': [0] * len(self.STANDARD_AGE_GROUPS)}
-        
-        # Age distribution weights (typical Korean pattern)
-        weights = {
-            "0-4": 0.025, "5-9": 0.03, "10-14": 0.035, "15-19": 0.04,
-            "20-24": 0.055, "25-29": 0.065, "30-34": 0.07, "35-39": 0.075,
-            "40-44": 0.08, "45-49": 0.085, "50-54": 0.085, "55-59": 0.08,
-            "60-64": 0.075, "65-69": 0.065, "70-74": 0.055, "75-79": 0.04,
-            "80-84": 0.025, "85+": 0.015,
-        }
-        
-        # Adjust weights based on actual cluster data
-        cluster_adjustment = {}
-        
-        # Children/Youth (0-19)
-        youth_groups = ["0-4", "5-9", "10-14", "15-19"]
-        youth_base = sum(weights[g] for g in youth_groups)
-        youth_actual = demo.children_youth / total if total > 0 else youth_base
-        for g in youth_groups:
-            cluster_adjustment[g] = youth_actual / youth_base if youth_base > 0 else 1
-        
-        # Productive (20-64)
-        prod_groups = ["20-24", "25-29", "30-34", "35-39", "40-44", 
-                       "45-49", "50-54", "55-59", "60-64"]
-        prod_base = sum(weights[g] for g in prod_groups)
-        prod_actual = demo.productive / total if total > 0 else prod_base
-        for g in prod_groups:
-            cluster_adjustment[g] = prod_actual / prod_base if prod_base > 0 else 1
-        
-        # Young-Old (65-74)
-        young_old_groups = ["65-69", "70-74"]
-        yo_base = sum(weights[g] for g in young_old_groups)
-        yo_actual = demo.young_old / total if total > 0 else yo_base
-        for g in young_old_groups:
-            cluster_adjustment[g] = yo_actual / yo_base if yo_base > 0 else 1
-        
-        # Old-Old (75+)
-        old_old_groups = ["75-79", "80-84", "85+"]
-        oo_base = sum(weights[g] for g in old_old_groups)
-        oo_actual = demo.old_old / total if total > 0 else oo_base
-        for g in old_old_groups:
-            cluster_adjustment[g] = oo_actual / oo_base if oo_base > 0 else 1
-        
-        # Calculate adjusted populations
-        male_ratio = demo.male_population / total if total > 0 else 0.49
-        
-        male_dist = []
-        female_dist = []
-        
-        for group in self.STANDARD_AGE_GROUPS:
-            base_weight = weights.get(group, 0.05)
-            adjusted_weight = base_weight * cluster_adjustment.get(group, 1)
-            group_pop = int(total * adjusted_weight)
-            
-            # Gender split varies by age
-            if group in ["75-79", "80-84", "85+"]:
-                male_pct = 0.38  # More females in oldest groups
-            elif group in ["65-69", "70-74"]:
-                male_pct = 0.45
-            else:
-                male_pct = 0.51
-            
-            male_dist.append(int(group_pop * male_pct))
-            female_dist.append(group_pop - int(group_pop * male_pct))
-        
-        return {'male': male_dist, 'female': female_dist}
+            zeros = np.zeros(len(self.STANDARD_AGE_GROUPS), dtype=np.int32)
+            return zeros, zeros.copy()
+        
+        # Scale each cluster's weights so the cluster sums to its actual share
+        adjusted = self._WEIGHTS.copy()
+        for cluster, sl in self._CLUSTER_SLICES.items():
+            base = sum(self._WEIGHTS[sl].tolist())
+            actual = getattr(demo, cluster.value) / total
+            adjusted[sl] *= actual / base
+        
+        # Calculate adjusted populations (int32: any age group fits); gender split varies by age
+        group_pop = (total * adjusted).astype(np.int32)
+        male = (group_pop * self._MALE_PCT).astype(np.int32)
+        female = group_pop - male
+        
+        return male, female
     
     def _generate_ticks(self, max_val: float) -> List[float]:
         """Generate nice tick values for symmetric axis"""
         # Round to nice number
-        magnitude = 10 ** int(np.log10(max_val))
-        nice_max = np.ceil(max_val / magnitude) * magnitude
+        magnitude = 10 ** int(math.log10(max_val))
+        nice_max = math.ceil(max_val / magnitude) * magnitude
         
-        step = nice_max / 4
-        ticks = []
-        for i in range(-4, 5):
-            ticks.append(i * step)
-        
-        return ticks
+        return (np.arange(-4, 5) * (nice_max / 4)).tolist()
     
-    def export_html(self, fig: go.Figure, filepath: str) -> None:
-        """Export figure to standalone HTML file"""
-        fig.write_html(filepath, include_plotlyjs=True, full_html=True)
+    def export_html(self, fig: go.Figure, filepath: str, embed: bool = False) -> None:
+        """
+        Export figure to an HTML file
+        
+        Args:
+            embed: Inline the full plotly.js bundle (~3.5MB) for offline viewing;
+                   by default the page loads plotly.js from the CDN
+        """
+        fig.write_html(filepath, include_plotlyjs=True if embed else 'cdn', full_html=True)
     
     def export_image(self, fig: go.Figure, filepath: str, 
                      format: str = "png", scale: int = 2) -> None:
         """Export figure to image file"""
-        fig.write_image(filepath, format=format, scale=scale)
+        self.export_images([(fig, filepath)], format=format, scale=scale)
+    
+    def export_images(self, items: List[Tuple[go.Figure, str]],
+                      format: str = "png", scale: int = 2) -> None:
+        """
+        Export many figures to image files in one batch
+        
+        With Kaleido >= 1.0 (plotly.io.write_images) all figures are rendered
+        in a single browser session instead of one start-up per file.
+        """
+        if not items:
+            return
+        
+        if hasattr(pio, "write_images"):
+            figs, paths = zip(*items)
+            pio.write_images(list(figs), list(paths), format=format, scale=scale)
+        else:
+            # Older Kaleido already reuses one persistent process across write_image calls
+            for fig, filepath in items:
+                fig.write_image(filepath, format=format, scale=scale)
+
+
+def _render_basic_pyramid(job: Tuple[str, DemographicData, bool]) -> str:
+    """Process-pool worker for PopulationPyramid.create_many[_json] (returns figure JSON)"""
+    theme, demo, show_clusters = job
+    return PopulationPyramid(theme).create_basic_pyramid(demo, show_clusters=show_clusters).to_json()
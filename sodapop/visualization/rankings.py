@@ -11,16 +11,153 @@ Features:
 - Trend sparklines
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+import gzip
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Any, Union
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
-import plotly.express as px
-import pandas as pd
 import numpy as np
 
 from sodapop.core.analyzer import TrendMetrics, UrgencyLevel, TrendDirection
 from sodapop.core.processor import DemographicData
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; sparklines fall back to NumPy
+    njit = None
+
+
+# Sparkline glyphs; index 0 is unused padding, values map to 1-8
+_SPARK_BLOCKS = " ▁▂▃▄▅▆▇█"
+_SPARK_CODES = np.array([ord(c) for c in _SPARK_BLOCKS], dtype='<u4')  # UTF-32 code points
+
+
+def _sparkline_indices_numpy(values: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Glyph index of each value, normalized per row over its first lengths[i] entries"""
+    valid = np.arange(values.shape[1]) < lengths[:, None]
+    lo = np.where(valid, values, np.inf).min(axis=1, keepdims=True)
+    hi = np.where(valid, values, -np.inf).max(axis=1, keepdims=True)
+    span = np.where(hi != lo, hi - lo, 1.0)
+    out = ((np.where(valid, values, lo) - lo) / span * 7).astype(np.int8) + 1
+    out[~valid] = 0
+    return out
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _sparkline_indices(values, lengths):
+        """Compiled per-row sparkline glyph indices (same arithmetic as the NumPy path)"""
+        out = np.zeros(values.shape, dtype=np.int8)
+        for i in range(values.shape[0]):
+            n = lengths[i]
+            lo = values[i, 0]
+            hi = values[i, 0]
+            for j in range(1, n):
+                v = values[i, j]
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+            span = hi - lo if hi != lo else 1.0
+            for j in range(n):
+                out[i, j] = int((values[i, j] - lo) / span * 7) + 1
+        return out
+else:
+    _sparkline_indices = _sparkline_indices_numpy
+
+
+@dataclass(slots=True)
+class _Columnar:
+    """
+    all_data as left-aligned (region, year) arrays
+    
+    Row i holds one region's years in ascending order in its first lengths[i]
+    columns, so its latest year is column lengths[i] - 1; the rest is padding.
+    """
+    row: Dict[str, int]             # region code -> row index
+    lengths: np.ndarray             # years per region (int64)
+    aging_ratio: np.ndarray         # float64, NaN padded
+    old_old_ratio: np.ndarray       # float64, NaN padded
+    total_population: np.ndarray    # int64, 0 padded
+    
+    def rows_for(self, metrics: List[Tuple[str, TrendMetrics]]) -> np.ndarray:
+        """Row of each (code, metrics) pair, -1 where the region has no data"""
+        return np.fromiter((self.row.get(code, -1) for code, _ in metrics),
+                           dtype=np.intp, count=len(metrics))
+    
+    def latest(self, column: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Latest-year values of column for the given rows"""
+        return column[rows, self.lengths[rows] - 1]
+
+
+def _to_columnar(all_data: Dict[str, Dict[int, DemographicData]]) -> _Columnar:
+    """Copy the per-region year dicts into a _Columnar (regions without years are left out)"""
+    regions = [(code, years) for code, years in all_data.items() if years]
+    lengths = np.fromiter((len(years) for _, years in regions), dtype=np.int64, count=len(regions))
+    shape = (len(regions), int(lengths.max()) if len(regions) else 0)
+    
+    aging_ratio = np.full(shape, np.nan, dtype=np.float64)
+    old_old_ratio = np.full(shape, np.nan, dtype=np.float64)
+    total_population = np.zeros(shape, dtype=np.int64)
+    for i, (_, years) in enumerate(regions):
+        for j, year in enumerate(sorted(years)):
+            data = years[year]
+            aging_ratio[i, j] = data.aging_ratio
+            old_old_ratio[i, j] = data.old_old_ratio
+            total_population[i, j] = data.total_population
+    
+    # Shared read-only between the charts (and threads) using the cache
+    for arr in (lengths, aging_ratio, old_old_ratio, total_population):
+        arr.setflags(write=False)
+    
+    return _Columnar(
+        row={code: i for i, (code, _) in enumerate(regions)},
+        lengths=lengths,
+        aging_ratio=aging_ratio,
+        old_old_ratio=old_old_ratio,
+        total_population=total_population,
+    )
+
+
+def _top_indices(keys: np.ndarray, k: int, descending: bool = False) -> np.ndarray:
+    """
+    Indices of the k smallest (or largest) keys, in the order sorted(...)[:k] gives
+    
+    Partitions around the k-th key instead of sorting everything; ties keep
+    their original order, as with Python's stable sort.
+    """
+    if descending:
+        keys = -keys
+    if k >= len(keys):
+        return np.argsort(keys, kind='stable')
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    kth = np.partition(keys, k - 1)[k - 1]
+    below = np.flatnonzero(keys < kth)
+    ties = np.flatnonzero(keys == kth)[:k - len(below)]
+    idx = np.concatenate((below, ties))
+    return idx[np.argsort(keys[idx], kind='stable')]
+
+
+def _level_values(metrics: List[Tuple[str, TrendMetrics]]) -> np.ndarray:
+    """UrgencyLevel.value of each (code, metrics) pair, for color-table indexing"""
+    return np.fromiter((m.urgency_level.value for _, m in metrics), dtype=np.int8, count=len(metrics))
+
+
+def _level_groups(levels: np.ndarray) -> List[Tuple[UrgencyLevel, np.ndarray]]:
+    """(level, row indices) for each UrgencyLevel present in levels, rows kept in order"""
+    # One stable sort; each level is then a contiguous slice of `order`
+    order = np.argsort(levels, kind='stable')
+    bounds = np.searchsorted(levels[order], np.arange(7))  # UrgencyLevel values are 1-5
+    return [
+        (level, order[bounds[level.value]:bounds[level.value + 1]])
+        for level in UrgencyLevel
+        if bounds[level.value] < bounds[level.value + 1]
+    ]
+
 
 class RankingCharts:
     """
@@ -39,6 +176,23 @@ class RankingCharts:
         UrgencyLevel.LOW: "#60A5FA",         # Blue
     }
     
+    # Lighter urgency colors for table cell backgrounds
+    URGENCY_BG_COLORS = {
+        UrgencyLevel.CRITICAL: "#FEE2E2",
+        UrgencyLevel.HIGH: "#FFEDD5",
+        UrgencyLevel.ELEVATED: "#FEF9C3",
+        UrgencyLevel.MODERATE: "#D1FAE5",
+        UrgencyLevel.LOW: "#DBEAFE",
+    }
+    
+    # The two palettes above indexed by UrgencyLevel.value (index 0 unused)
+    _URGENCY_COLOR_TABLE = np.array(
+        ["white", *map(URGENCY_COLORS.get, map(UrgencyLevel, range(1, 6)))], dtype=object
+    )
+    _URGENCY_BG_TABLE = np.array(
+        ["white", *map(URGENCY_BG_COLORS.get, map(UrgencyLevel, range(1, 6)))], dtype=object
+    )
+    
     # Trend direction colors
     TREND_COLORS = {
         TrendDirection.RAPID_INCREASE: "#DC2626",
@@ -48,8 +202,74 @@ class RankingCharts:
         TrendDirection.RAPID_DECREASE: "#3B82F6",
     }
     
+    # Background zones of the urgency ranking: (x0, x1, label, color)
+    URGENCY_ZONES = (
+        (80, 100, "위험", "#FEE2E2"),
+        (60, 80, "높음", "#FFEDD5"),
+        (40, 60, "주의", "#FEF9C3"),
+        (0, 40, "보통", "#ECFDF5"),
+    )
+    _URGENCY_ZONE_SHAPES = tuple(
+        dict(type="rect", xref="x", yref="paper", x0=x0, x1=x1, y0=0, y1=1,
+             fillcolor=color, opacity=0.3, layer="below", line_width=0)
+        for x0, x1, _, color in URGENCY_ZONES
+    )
+    
+    # Dashboard title, also used for the empty-data figure
+    _DASHBOARD_TITLE = dict(text="🎯 복지 우선순위 대시보드", font=dict(size=22), x=0.5)
+    
+    # Horizontal urgency-level legend above the plot area
+    _URGENCY_LEGEND = dict(
+        title="긴급도 수준", orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5,
+    )
+    
     def __init__(self, theme: str = "plotly_white"):
         self.theme = theme
+        # Resolve the template once instead of looking the name up for every figure
+        self._template = pio.templates[theme]
+        # Columnar copy of the all_data dict last passed in, with the structure
+        # it was built from; the lock lets one instance serve several threads
+        self._lock = threading.Lock()
+        self._columns_source: Optional[Dict[str, Dict[int, DemographicData]]] = None
+        self._columns_shape: List[Tuple[str, Dict[int, DemographicData], int]] = []
+        self._columns: Optional[_Columnar] = None
+    
+    @staticmethod
+    def _data_shape(all_data: Dict[str, Dict[int, DemographicData]]
+                    ) -> List[Tuple[str, Dict[int, DemographicData], int]]:
+        """(code, year dict, year count) per region, compared to detect in-place changes"""
+        return [(code, years, len(years)) for code, years in all_data.items()]
+    
+    def _columnar(self, all_data: Dict[str, Dict[int, DemographicData]]) -> _Columnar:
+        """
+        Columnar (region, year) arrays of all_data
+        
+        Rebuilt whenever all_data is a different object, or when regions are
+        added, removed or replaced, or gain or lose years (e.g. after
+        all_data.update(...)). Replacing a DemographicData inside an existing
+        year dict is not detected; call clear_cache() after such edits.
+        """
+        shape = self._data_shape(all_data)
+        with self._lock:
+            current = (
+                all_data is self._columns_source
+                and len(shape) == len(self._columns_shape)
+                and all(code == old_code and years is old_years and n == old_n
+                        for (code, years, n), (old_code, old_years, old_n)
+                        in zip(shape, self._columns_shape))
+            )
+            if not current:
+                self._columns = _to_columnar(all_data)
+                self._columns_source = all_data
+                self._columns_shape = shape
+            return self._columns
+    
+    def clear_cache(self) -> None:
+        """Drop the cached columnar copy of all_data"""
+        with self._lock:
+            self._columns_source = None
+            self._columns_shape = []
+            self._columns = None
     
     def create_urgency_ranking(self,
                                 rankings: List[Tuple[str, TrendMetrics]],
@@ -71,54 +291,32 @@ class RankingCharts:
         
         # Prepare data
         region_names = [m.region_name for _, m in top_regions]
-        urgency_scores = [m.urgency_score for _, m in top_regions]
-        urgency_levels = [m.urgency_level for _, m in top_regions]
-        factors = ["; ".join(m.urgency_factors[:2]) for _, m in top_regions]
-        
-        # Colors based on urgency level
-        colors = [self.URGENCY_COLORS[level] for level in urgency_levels]
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            y=region_names[::-1],  # Reverse for top-to-bottom ranking
-            x=urgency_scores[::-1],
-            orientation='h',
-            marker_color=colors[::-1],
-            text=[f"{s:.1f}" for s in urgency_scores[::-1]],
-            textposition='outside',
-            hovertemplate=(
-                "<b>%{y}</b><br>" +
-                "긴급도 점수: %{x:.1f}<br>" +
-                "<extra></extra>"
-            ),
-            customdata=factors[::-1],
-        ))
+        names = np.array(region_names, dtype=object)
+        urgency_scores = np.array([m.urgency_score for _, m in top_regions], dtype=np.float64)
+        factors = np.array(["; ".join(m.urgency_factors[:2]) for _, m in top_regions], dtype=object)
+        
+        # One bar trace per urgency level: colors the bars and doubles as its legend entry
+        traces = [
+            dict(
+                type='bar',
+                y=names[idx],
+                x=urgency_scores[idx],
+                orientation='h',
+                marker=dict(color=self.URGENCY_COLORS[level]),
+                texttemplate="%{x:.1f}",  # formatted by plotly.js, no per-bar strings
+                textposition='outside',
+                hovertemplate=(
+                    "<b>%{y}</b><br>" +
+                    "긴급도 점수: %{x:.1f}<br>" +
+                    "<extra></extra>"
+                ),
+                customdata=factors[idx],
+                name=level.name,
+            )
+            for level, idx in _level_groups(_level_values(top_regions))
+        ]
         
-        # Add urgency level annotations
-        shapes = []
-        annotations = []
-        
-        # Background zones for urgency levels
-        zone_boundaries = [(80, 100, "위험", "#FEE2E2"),
-                          (60, 80, "높음", "#FFEDD5"),
-                          (40, 60, "주의", "#FEF9C3"),
-                          (0, 40, "보통", "#ECFDF5")]
-        
-        for x0, x1, label, color in zone_boundaries:
-            shapes.append(dict(
-                type="rect",
-                xref="x",
-                yref="paper",
-                x0=x0,
-                x1=x1,
-                y0=0,
-                y1=1,
-                fillcolor=color,
-                opacity=0.3,
-                layer="below",
-                line_width=0,
-            ))
+        fig = go.Figure(data=traces)
         
         fig.update_layout(
             title=dict(
@@ -126,7 +324,7 @@ class RankingCharts:
                 font=dict(size=20, family="Pretendard, sans-serif"),
                 x=0.5,
             ),
-            template=self.theme,
+            template=self._template,
             xaxis=dict(
                 title="긴급도 점수 (0-100)",
                 range=[0, 105],
@@ -135,33 +333,16 @@ class RankingCharts:
             yaxis=dict(
                 title="",
                 tickfont=dict(size=11),
+                categoryorder='array',
+                categoryarray=region_names,
+                autorange='reversed',  # top-ranked region first
             ),
-            shapes=shapes,
+            barmode='overlay',
+            shapes=self._URGENCY_ZONE_SHAPES,
             height=max(400, 30 * top_n),
             margin=dict(l=150, r=50, t=80, b=60),
             showlegend=False,
-        )
-        
-        # Add legend for urgency levels
-        for level, color in self.URGENCY_COLORS.items():
-            fig.add_trace(go.Scatter(
-                x=[None],
-                y=[None],
-                mode='markers',
-                marker=dict(size=12, color=color),
-                name=level.name,
-                showlegend=True,
-            ))
-        
-        fig.update_layout(
-            legend=dict(
-                title="긴급도 수준",
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="center",
-                x=0.5,
-            )
+            legend=self._URGENCY_LEGEND,
         )
         
         return fig
@@ -182,34 +363,46 @@ class RankingCharts:
         velocities = [m.aging_velocity for _, m in top_regions]
         trends = [m.aging_velocity_trend for _, m in top_regions]
         
-        fig = go.Figure()
-        
-        # Add lollipop stems
-        for i, (name, vel, trend) in enumerate(zip(region_names, velocities, trends)):
-            color = self.TREND_COLORS[trend]
-            
-            # Stem
-            fig.add_trace(go.Scatter(
-                x=[0, vel],
-                y=[name, name],
-                mode='lines',
-                line=dict(color=color, width=2),
-                showlegend=False,
-                hoverinfo='skip',
-            ))
-            
-            # Dot
-            fig.add_trace(go.Scatter(
-                x=[vel],
-                y=[name],
-                mode='markers+text',
-                marker=dict(size=14, color=color, line=dict(width=2, color='white')),
-                text=[f"{vel:.1f}%"],
-                textposition='middle right',
-                textfont=dict(size=10),
-                showlegend=False,
-                hovertemplate=f"<b>{name}</b><br>고령화속도: {vel:.1f}%/년<extra></extra>",
-            ))
+        # Plain trace dicts, validated once by go.Figure
+        traces = []
+        
+        # Lollipop stems: one None-separated line trace per trend direction
+        for direction in TrendDirection:
+            stem_x, stem_y = [], []
+            for name, vel, trend in zip(region_names, velocities, trends):
+                if trend is direction:
+                    stem_x += (0, vel, None)
+                    stem_y += (name, name, None)
+            if stem_x:
+                traces.append(dict(
+                    type='scatter',
+                    x=stem_x,
+                    y=stem_y,
+                    mode='lines',
+                    line=dict(color=self.TREND_COLORS[direction], width=2),
+                    showlegend=False,
+                    hoverinfo='skip',
+                ))
+        
+        # Dots for all regions in a single trace
+        traces.append(dict(
+            type='scatter',
+            x=velocities,
+            y=region_names,
+            mode='markers+text',
+            marker=dict(
+                size=14,
+                color=[self.TREND_COLORS[trend] for trend in trends],
+                line=dict(width=2, color='white'),
+            ),
+            texttemplate="%{x:.1f}%",
+            textposition='middle right',
+            textfont=dict(size=10),
+            showlegend=False,
+            hovertemplate="<b>%{y}</b><br>고령화속도: %{x:.1f}%/년<extra></extra>",
+        ))
+        
+        fig = go.Figure(data=traces)
         
         # Add national average line
         if include_national:
@@ -228,7 +421,7 @@ class RankingCharts:
                 font=dict(size=18),
                 x=0.5,
             ),
-            template=self.theme,
+            template=self._template,
             xaxis=dict(
                 title="연평균 증가율 (%)",
                 zeroline=True,
@@ -238,7 +431,8 @@ class RankingCharts:
             yaxis=dict(
                 title="",
                 categoryorder='array',
-                categoryarray=region_names[::-1],
+                categoryarray=region_names,
+                autorange='reversed',
             ),
             height=max(400, 40 * top_n),
             margin=dict(l=150, r=100, t=100, b=60),
@@ -259,6 +453,12 @@ class RankingCharts:
         - Population change
         - Old-old ratio
         """
+        if not all_metrics or top_n <= 0:
+            # Nothing to rank: skip the subplot grid and the selections
+            return go.Figure(layout=dict(
+                title=self._DASHBOARD_TITLE, template=self._template, height=800,
+            ))
+        
         fig = make_subplots(
             rows=2, cols=2,
             subplot_titles=[
@@ -272,77 +472,70 @@ class RankingCharts:
         )
         
         top_urgency = all_metrics[:top_n]
-        top_velocity = sorted(all_metrics, key=lambda x: x[1].aging_velocity, reverse=True)[:top_n]
-        top_decline = sorted(all_metrics, key=lambda x: x[1].total_change_percent)[:top_n]
+        
+        # Partial top-N selections instead of full sorts
+        n = len(all_metrics)
+        velocity = np.fromiter((m.aging_velocity for _, m in all_metrics), dtype=np.float64, count=n)
+        change = np.fromiter((m.total_change_percent for _, m in all_metrics), dtype=np.float64, count=n)
+        top_velocity = [all_metrics[i] for i in _top_indices(velocity, top_n, descending=True)]
+        top_decline = [all_metrics[i] for i in _top_indices(change, top_n)]
         
         # Get old-old ratios from latest data
-        old_old_data = []
-        for code, metrics in all_metrics:
-            if code in all_data:
-                latest_year = max(all_data[code].keys())
-                old_old_ratio = all_data[code][latest_year].old_old_ratio
-                old_old_data.append((code, metrics, old_old_ratio))
-        top_old_old = sorted(old_old_data, key=lambda x: x[2], reverse=True)[:top_n]
-        
-        # 1. Urgency ranking
-        fig.add_trace(
-            go.Bar(
-                y=[m.region_name for _, m in top_urgency][::-1],
-                x=[m.urgency_score for _, m in top_urgency][::-1],
+        columns = self._columnar(all_data)
+        rows = columns.rows_for(all_metrics)
+        with_data = np.flatnonzero(rows >= 0)
+        old_old = columns.latest(columns.old_old_ratio, rows[with_data])
+        top = _top_indices(old_old, top_n, descending=True)
+        top_old_old = [all_metrics[i] for i in with_data[top]]
+        top_old_old_ratios = old_old[top]
+        
+        traces = [
+            # 1. Urgency ranking
+            dict(
+                type='bar',
+                y=[m.region_name for _, m in top_urgency],
+                x=[m.urgency_score for _, m in top_urgency],
                 orientation='h',
-                marker_color=[self.URGENCY_COLORS[m.urgency_level] for _, m in top_urgency][::-1],
+                marker=dict(color=self._URGENCY_COLOR_TABLE[_level_values(top_urgency)]),
                 name="긴급도",
                 showlegend=False,
             ),
-            row=1, col=1
-        )
-        
-        # 2. Aging velocity
-        fig.add_trace(
-            go.Bar(
-                y=[m.region_name for _, m in top_velocity][::-1],
-                x=[m.aging_velocity for _, m in top_velocity][::-1],
+            # 2. Aging velocity
+            dict(
+                type='bar',
+                y=[m.region_name for _, m in top_velocity],
+                x=[m.aging_velocity for _, m in top_velocity],
                 orientation='h',
-                marker_color='#F97316',
+                marker=dict(color='#F97316'),
                 name="고령화속도",
                 showlegend=False,
             ),
-            row=1, col=2
-        )
-        
-        # 3. Population decline
-        fig.add_trace(
-            go.Bar(
-                y=[m.region_name for _, m in top_decline][::-1],
-                x=[m.total_change_percent for _, m in top_decline][::-1],
+            # 3. Population decline
+            dict(
+                type='bar',
+                y=[m.region_name for _, m in top_decline],
+                x=[m.total_change_percent for _, m in top_decline],
                 orientation='h',
-                marker_color='#DC2626',
+                marker=dict(color='#DC2626'),
                 name="인구변화",
                 showlegend=False,
             ),
-            row=2, col=1
-        )
-        
-        # 4. Old-old ratio
-        fig.add_trace(
-            go.Bar(
-                y=[m.region_name for _, m, _ in top_old_old][::-1],
-                x=[ratio for _, _, ratio in top_old_old][::-1],
+            # 4. Old-old ratio
+            dict(
+                type='bar',
+                y=[m.region_name for _, m in top_old_old],
+                x=top_old_old_ratios,
                 orientation='h',
-                marker_color='#7C3AED',
+                marker=dict(color='#7C3AED'),
                 name="후기고령비율",
                 showlegend=False,
             ),
-            row=2, col=2
-        )
+        ]
+        fig.add_traces(traces, rows=[1, 1, 2, 2], cols=[1, 2, 1, 2])
         
         fig.update_layout(
-            title=dict(
-                text="🎯 복지 우선순위 대시보드",
-                font=dict(size=22),
-                x=0.5,
-            ),
-            template=self.theme,
+            title=self._DASHBOARD_TITLE,
+            template=self._template,
             height=800,
             margin=dict(l=120, r=40, t=100, b=40),
         )
@@ -352,6 +545,7 @@ class RankingCharts:
         fig.update_xaxes(title_text="연증가율 (%)", row=1, col=2)
         fig.update_xaxes(title_text="인구변화율 (%)", row=2, col=1)
         fig.update_xaxes(title_text="후기고령 비율 (%)", row=2, col=2)
+        fig.update_yaxes(autorange='reversed')  # top-ranked region first in every panel
         
         return fig
     
@@ -372,33 +566,27 @@ class RankingCharts:
         ranks = list(range(1, top_n + 1))
         names = [m.region_name for _, m in top_regions]
         
-        populations = []
-        aging_ratios = []
-        urgencies = []
-        
-        for code, metrics in top_regions:
-            if code in all_data:
-                latest_year = max(all_data[code].keys())
-                latest = all_data[code][latest_year]
-                populations.append(f"{latest.total_population:,}")
-                aging_ratios.append(f"{latest.aging_ratio:.1f}%")
-            else:
-                populations.append("-")
-                aging_ratios.append("-")
-            
-            urgencies.append(f"{metrics.urgency_score:.0f}")
-        
-        # Create trend indicators (unicode sparklines)
-        trends = []
-        for code, metrics in top_regions:
-            if code in all_data:
-                years = sorted(all_data[code].keys())
-                ratios = [all_data[code][y].aging_ratio for y in years]
-                # Simple sparkline using unicode blocks
-                sparkline = self._create_text_sparkline(ratios)
-                trends.append(sparkline)
-            else:
-                trends.append("─" * 5)
+        populations = ["-"] * len(top_regions)
+        aging_ratios = ["-"] * len(top_regions)
+        urgencies = [f"{m.urgency_score:.0f}" for _, m in top_regions]
+        
+        columns = self._columnar(all_data)
+        rows = columns.rows_for(top_regions)
+        with_data = np.flatnonzero(rows >= 0)
+        data_rows = rows[with_data]
+        for i, pop, ratio in zip(with_data.tolist(),
+                                 columns.latest(columns.total_population, data_rows).tolist(),
+                                 columns.latest(columns.aging_ratio, data_rows).tolist()):
+            populations[i] = f"{pop:,}"
+            aging_ratios[i] = f"{ratio:.1f}%"
+        
+        # Create trend indicators (unicode sparklines) straight from the aging-ratio rows
+        trends = ["─" * 5] * len(top_regions)
+        with_trend = with_data[columns.lengths[data_rows] >= 2]
+        trend_rows = rows[with_trend]
+        sparklines = self._sparkline_strings(columns.aging_ratio[trend_rows], columns.lengths[trend_rows])
+        for i, sparkline in zip(with_trend.tolist(), sparklines):
+            trends[i] = sparkline
         
         fig = go.Figure(data=[go.Table(
             header=dict(
@@ -415,7 +603,7 @@ class RankingCharts:
                     ['white'] * top_n,
                     ['white'] * top_n,
                     ['white'] * top_n,
-                    [self._urgency_to_bgcolor(m.urgency_level) for _, m in top_regions],
+                    self._URGENCY_BG_TABLE[_level_values(top_regions)].tolist(),
                     ['white'] * top_n,
                 ],
                 font=dict(size=12),
@@ -430,7 +618,7 @@ class RankingCharts:
                 font=dict(size=18),
                 x=0.5,
             ),
-            template=self.theme,
+            template=self._template,
             height=50 + 35 + (30 * top_n),
             margin=dict(l=20, r=20, t=60, b=20),
         )
@@ -449,51 +637,50 @@ class RankingCharts:
         Size: Population
         Color: Urgency level
         """
-        data_points = []
-        
-        for code, metrics in all_metrics:
-            if code in all_data:
-                latest_year = max(all_data[code].keys())
-                latest = all_data[code][latest_year]
-                
-                data_points.append({
-                    'region': metrics.region_name,
-                    'aging_ratio': latest.aging_ratio,
-                    'aging_velocity': metrics.aging_velocity,
-                    'population': latest.total_population,
-                    'urgency_score': metrics.urgency_score,
-                    'urgency_level': metrics.urgency_level.name,
-                    'color': self.URGENCY_COLORS[metrics.urgency_level],
-                })
-        
-        df = pd.DataFrame(data_points)
-        
-        fig = go.Figure()
-        
-        for level in UrgencyLevel:
-            level_df = df[df['urgency_level'] == level.name]
-            if len(level_df) > 0:
-                fig.add_trace(go.Scatter(
-                    x=level_df['aging_ratio'],
-                    y=level_df['aging_velocity'],
-                    mode='markers+text',
-                    marker=dict(
-                        size=level_df['population'] / level_df['population'].max() * 50 + 10,
-                        color=self.URGENCY_COLORS[level],
-                        opacity=0.7,
-                        line=dict(width=1, color='white'),
-                    ),
-                    text=level_df['region'],
-                    textposition='top center',
-                    textfont=dict(size=9),
-                    name=level.name,
-                    hovertemplate=(
-                        "<b>%{text}</b><br>" +
-                        "고령화율: %{x:.1f}%<br>" +
-                        "고령화속도: %{y:.1f}%<br>" +
-                        "<extra></extra>"
-                    ),
-                ))
+        # Plotted columns for the regions with data: latest-year values from the
+        # columnar cache, the rest from the metrics
+        columns = self._columnar(all_data)
+        rows = columns.rows_for(all_metrics)
+        with_data = np.flatnonzero(rows >= 0)
+        count = len(with_data)
+        shown = [all_metrics[i][1] for i in with_data.tolist()]
+        
+        names = np.array([m.region_name for m in shown], dtype=object)
+        velocities = np.fromiter((m.aging_velocity for m in shown), dtype=np.float64, count=count)
+        levels = np.fromiter((m.urgency_level.value for m in shown), dtype=np.int8, count=count)
+        aging_ratios = columns.latest(columns.aging_ratio, rows[with_data])
+        populations = columns.latest(columns.total_population, rows[with_data]).astype(np.float64)
+        
+        # Bubble size relative to the largest region overall, so sizes compare across levels
+        peak = populations.max() if count else 0.0
+        sizes = populations * (50.0 / peak) + 10.0 if peak > 0 else np.full(count, 10.0)
+        
+        traces = []
+        for level, idx in _level_groups(levels):
+            traces.append(dict(
+                type='scatter',
+                x=aging_ratios[idx],
+                y=velocities[idx],
+                mode='markers+text',
+                marker=dict(
+                    size=sizes[idx],
+                    color=self.URGENCY_COLORS[level],
+                    opacity=0.7,
+                    line=dict(width=1, color='white'),
+                ),
+                text=names[idx],
+                textposition='top center',
+                textfont=dict(size=9),
+                name=level.name,
+                hovertemplate=(
+                    "<b>%{text}</b><br>" +
+                    "고령화율: %{x:.1f}%<br>" +
+                    "고령화속도: %{y:.1f}%<br>" +
+                    "<extra></extra>"
+                ),
+            ))
+        
+        fig = go.Figure(data=traces)
         
         # Add reference lines
         fig.add_hline(y=4.2, line_dash="dash", line_color="gray",
@@ -518,7 +705,7 @@ class RankingCharts:
                 font=dict(size=18),
                 x=0.5,
             ),
-            template=self.theme,
+            template=self._template,
             xaxis=dict(
                 title="고령화율 (65세 이상 비율 %)",
                 range=[5, 35],
@@ -527,49 +714,44 @@ class RankingCharts:
                 title="고령화 속도 (연평균 증가율 %)",
                 range=[-2, 12],
             ),
-            legend=dict(
-                title="긴급도 수준",
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="center",
-                x=0.5,
-            ),
+            legend=self._URGENCY_LEGEND,
             height=600,
         )
         
         return fig
     
-    def _create_text_sparkline(self, values: List[float]) -> str:
-        """Create a simple text-based sparkline using unicode blocks"""
-        if not values or len(values) < 2:
-            return "─" * 5
-        
-        # Normalize values to 0-7 range for block characters
-        min_val = min(values)
-        max_val = max(values)
-        range_val = max_val - min_val if max_val != min_val else 1
+    def _sparkline_strings(self, values: np.ndarray, lengths: np.ndarray) -> List[str]:
+        """Sparkline of each row's first lengths[i] values (every length must be >= 2)"""
+        if len(values) == 0:
+            return []
+        
+        # Decode every row at once, then cut each row's string to its length
+        width = values.shape[1]
+        text = _SPARK_CODES[_sparkline_indices(values, lengths)].tobytes().decode('utf-32-le')
+        return [text[r * width:r * width + n] for r, n in enumerate(lengths.tolist())]
+    
+    def export_html(self, fig: go.Figure, filepath: str,
+                    include_plotlyjs: Union[bool, str] = 'cdn',
+                    compress: bool = False) -> None:
+        """
+        Export figure to an HTML file
         
-        blocks = " ▁▂▃▄▅▆▇█"
-        sparkline = ""
+        Args:
+            include_plotlyjs: 'cdn' (default) loads plotly.js from the CDN; True inlines
+                              the ~3.5MB bundle for offline viewing; 'directory'
+                              references a shared plotly.min.js next to the file
+            compress: Write gzip-compressed HTML to filepath + ".gz"
+                      (not combinable with 'directory', whose bundle is only
+                      written by the uncompressed export)
+        """
+        if not compress:
+            fig.write_html(filepath, include_plotlyjs=include_plotlyjs, full_html=True)
+            return
         
-        for v in values:
-            idx = int((v - min_val) / range_val * 7)
-            sparkline += blocks[idx + 1]
+        if include_plotlyjs == 'directory':
+            raise ValueError("compress=True cannot be used with include_plotlyjs='directory'")
         
-        return sparkline
-    
-    def _urgency_to_bgcolor(self, level: UrgencyLevel) -> str:
-        """Convert urgency level to lighter background color"""
-        color_map = {
-            UrgencyLevel.CRITICAL: "#FEE2E2",
-            UrgencyLevel.HIGH: "#FFEDD5",
-            UrgencyLevel.ELEVATED: "#FEF9C3",
-            UrgencyLevel.MODERATE: "#D1FAE5",
-            UrgencyLevel.LOW: "#DBEAFE",
-        }
-        return color_map.get(level, "white")
-    
-    def export_html(self, fig: go.Figure, filepath: str) -> None:
-        """Export figure to standalone HTML file"""
-        fig.write_html(filepath, include_plotlyjs=True, full_html=True)
+        if not filepath.endswith(".gz"):
+            filepath += ".gz"
+        with gzip.open(filepath, "wt", encoding="utf-8") as f:
+            f.write(fig.to_html(include_plotlyjs=include_plotlyjs, full_html=True))
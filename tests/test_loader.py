@@ -0,0 +1,53 @@
+"""KOSISDataLoader CSV preprocessing edge cases"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from sodapop.data.loader import KOSISDataLoader
+
+
+HEADER = "행정구역코드,행정구역,시점,연령,성별,인구수\n"
+
+
+class LoadFromCsvYearTest(unittest.TestCase):
+    """Year conversion must tolerate empty and missing year columns"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.loader = KOSISDataLoader(data_dir=self.tmp.name)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def _load(self, body: str):
+        path = Path(self.tmp.name) / "pop.csv"
+        path.write_text(HEADER + body, encoding="utf-8")
+        return self.loader.load_from_csv(str(path))
+    
+    def test_only_total_rows_gives_empty_frame(self):
+        df = self._load(
+            "1100000000,서울특별시,2024,계,계,9000000\n"
+            "0000000000,전국,2024,0~4세,남자,100\n"
+        )
+        self.assertEqual(len(df), 0)
+        self.assertEqual(str(df['year'].dtype), 'Int64')
+    
+    def test_blank_year_is_kept_as_na(self):
+        df = self._load(
+            "1100000000,서울특별시,,0~4세,남자,100\n"
+        )
+        self.assertEqual(len(df), 1)
+        self.assertEqual(str(df['year'].dtype), 'Int64')
+        self.assertTrue(df['year'].isna().all())
+    
+    def test_regular_years_fit_int16(self):
+        df = self._load(
+            "1100000000,서울특별시,2024,0~4세,남자,100\n"
+        )
+        self.assertEqual(str(df['year'].dtype), 'Int16')
+        self.assertEqual(int(df['year'].iloc[0]), 2024)
+
+
+if __name__ == "__main__":
+    unittest.main()